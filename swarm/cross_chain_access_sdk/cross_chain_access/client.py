@@ -2,8 +2,11 @@
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Optional
+
+import httpx
 
 from swarm.shared.base_client import BaseAPIClient, APIException
 from swarm.shared.config import get_cross_chain_access_api_url, get_is_dev
@@ -36,12 +39,15 @@ class CrossChainAccessAPIClient(BaseAPIClient):
         >>> quote = await client.get_asset_quote("AAPL")
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         """Initialize Cross-Chain Access API client.
         
         Environment is determined by SWARM_COLLECTION_MODE env variable.
+        
+        Args:
+            transport: Optional shared HTTP connection pool (not closed by close())
         """
-        super().__init__(base_url=get_cross_chain_access_api_url())
+        super().__init__(base_url=get_cross_chain_access_api_url(), transport=transport)
         
         logger.info(
             f"Initialized Cross-Chain Access API client ({'dev' if get_is_dev() else 'prod'} mode)"
@@ -160,7 +166,7 @@ class CrossChainAccessAPIClient(BaseAPIClient):
             try:
                 timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
             except Exception:
-                timestamp = datetime.utcnow()
+                timestamp = datetime.now(timezone.utc)
             
             quote = CrossChainAccessQuote(
                 bid_price=Decimal(str(attrs.get("bidPrice", 0))),
@@ -289,7 +295,7 @@ class CrossChainAccessAPIClient(BaseAPIClient):
             try:
                 created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
             except Exception:
-                created_at = datetime.utcnow()
+                created_at = datetime.now(timezone.utc)
             
             filled_at = None
             if filled_at_str:
@@ -3,9 +3,11 @@
 import asyncio
 import logging
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+import httpx
+
 from swarm.shared.models import Network, Quote, TradeResult
 from swarm.shared.swarm_auth import SwarmAuth
 from swarm.shared.web3 import Web3Helper
@@ -73,12 +75,16 @@ class CrossChainAccessClient:
     # Slippage protection (1%)
     SLIPPAGE_PERCENTAGE = Decimal("1")
     
+    # Re-authenticate in the background when the token expires within this window
+    AUTH_REFRESH_LEAD_SECONDS = 60
+    
     def __init__(
         self,
         network: Network,
         private_key: str,
         user_email: Optional[str] = None,
         rpc_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize Cross-Chain Access client.
         
@@ -87,11 +93,13 @@ class CrossChainAccessClient:
             private_key: Private key for signing transactions
             user_email: Optional email for authentication
             rpc_url: Optional custom RPC URL
+            transport: Optional HTTP connection pool shared with other clients.
+                It is not closed by close(); the caller owns it.
         """
         self.network = network
         
         # Initialize API client
-        self.cross_chain_access_api = CrossChainAccessAPIClient()
+        self.cross_chain_access_api = CrossChainAccessAPIClient(transport=transport)
         
         # Initialize Web3 helper
         self.web3_helper = Web3Helper(
@@ -101,7 +109,7 @@ class CrossChainAccessClient:
         )
         
         # Initialize auth
-        self.auth = SwarmAuth()
+        self.auth = SwarmAuth(transport=transport)
         self.user_email = user_email
         
         # Get USDC address for this network
@@ -112,6 +120,10 @@ class CrossChainAccessClient:
         # Topup address will be fetched lazily on first use
         self.topup_address: Optional[str] = None
         
+        self._reauth_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._close_lock = asyncio.Lock()
+        
         logger.info(
             f"Initialized Cross-Chain Access client for {network.name} "
             f"({'dev' if get_is_dev() else 'prod'} mode) "
@@ -148,6 +160,36 @@ class CrossChainAccessClient:
         
         logger.info("Successfully authenticated with Swarm platform")
     
+    async def _ensure_authenticated(self):
+        """Make sure a usable auth token is set before an API call.
+        
+        Authenticates inline when there is no token or it has expired. When the
+        token is merely close to expiry, the current call proceeds with it and
+        re-authentication runs in the background.
+        """
+        if not self.cross_chain_access_api.auth_token:
+            logger.info("No auth token found, authenticating...")
+            await self.authenticate()
+            return
+        
+        tokens = self.auth.load_tokens(self.web3_helper.account.address)
+        if tokens is None or not tokens.is_expired(leeway=self.AUTH_REFRESH_LEAD_SECONDS):
+            return
+        
+        if tokens.is_expired():
+            logger.info("Auth token expired, authenticating...")
+            await self.authenticate()
+        elif self._reauth_task is None or self._reauth_task.done():
+            logger.info("Auth token near expiry, re-authenticating in background")
+            self._reauth_task = asyncio.create_task(self._reauthenticate())
+    
+    async def _reauthenticate(self):
+        """Background re-authentication; failures are logged, not raised."""
+        try:
+            await self.authenticate()
+        except Exception as e:
+            logger.warning(f"Background re-authentication failed: {e}")
+    
     async def _load_topup_address(self):
         """Load topup address from remote configuration.
         
@@ -159,14 +201,27 @@ class CrossChainAccessClient:
             logger.info(f"Topup address loaded: {self.topup_address}")
     
     async def close(self):
-        """Close all clients and cleanup resources."""
-        if hasattr(self.cross_chain_access_api, 'close'):
-            await self.cross_chain_access_api.close()
-        
-        # Close remote config fetcher sessions
-        await close_config_fetchers()
-        
-        logger.info("Cross-Chain Access client closed")
+        """Close all clients and cleanup resources. Safe to call more than once."""
+        async with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+            # Stop a background re-authentication before its clients go away
+            if self._reauth_task is not None:
+                self._reauth_task.cancel()
+                await asyncio.gather(self._reauth_task, return_exceptions=True)
+                self._reauth_task = None
+            
+            if hasattr(self.cross_chain_access_api, 'close'):
+                await self.cross_chain_access_api.close()
+            
+            await self.web3_helper.close()
+            
+            # Close remote config fetcher sessions
+            await close_config_fetchers()
+            
+            logger.info("Cross-Chain Access client closed")
     
     async def check_trading_availability(self) -> tuple[bool, str]:
         """Check if trading is currently available.
@@ -185,9 +240,7 @@ class CrossChainAccessClient:
             ...     print(f"Trading not available: {message}")
         """
         # Ensure authentication before checking account status
-        if not self.cross_chain_access_api.auth_token:
-            logger.info("No auth token found, authenticating...")
-            await self.authenticate()
+        await self._ensure_authenticated()
         
         # Check market hours
         is_open, market_message = MarketHours.get_market_status()
@@ -247,7 +300,7 @@ class CrossChainAccessClient:
             buy_amount=Decimal("1") / cross_chain_access_quote.ask_price,
             rate=cross_chain_access_quote.ask_price,
             source="cross_chain_access",
-            timestamp=datetime.now(),
+            timestamp=datetime.now(timezone.utc),
         )
     
     async def buy(
@@ -417,9 +470,7 @@ class CrossChainAccessClient:
         logger.info(f"Starting {order_side.value} trade for {rwa_symbol}")
         
         # Step 0: Ensure authentication
-        if not self.cross_chain_access_api.auth_token:
-            logger.info("No auth token found, authenticating...")
-            await self.authenticate()
+        await self._ensure_authenticated()
         
         # Step 1: Check trading availability
         is_available, message = await self.check_trading_availability()
@@ -532,6 +583,6 @@ class CrossChainAccessClient:
             buy_amount=final_rwa if order_side == OrderSide.BUY else final_usdc,
             rate=price,
             source="cross_chain_access",
-            timestamp=datetime.now(),
+            timestamp=datetime.now(timezone.utc),
             network=self.network,
         )
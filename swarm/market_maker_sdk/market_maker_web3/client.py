@@ -11,7 +11,6 @@ from web3.exceptions import ContractLogicError
 
 from swarm.shared.web3 import Web3Helper, Web3Exception, TransactionFailedException
 from swarm.shared.models import Network
-from swarm.shared.constants import TOKEN_DECIMALS
 from .constants import MARKET_MAKER_MANAGER_ABI, get_market_maker_manager_address
 from .exceptions import (
     MarketMakerWeb3Exception,
@@ -80,6 +79,10 @@ class MarketMakerWeb3Client:
             f"with account {self.account.address}"
         )
     
+    async def close(self):
+        """Release the Web3 helper's RPC connections."""
+        await self.web3_helper.close()
+    
     async def _ensure_contract_loaded(self):
         """Ensure Market Maker Manager contract is loaded.
         
@@ -172,9 +175,7 @@ class MarketMakerWeb3Client:
             
             # Step 1: Approve Market Maker contract to spend withdrawal tokens
             # Convert back to normalized units for approval
-            token_decimals = TOKEN_DECIMALS.get(
-                self.network.value, {}
-            ).get(withdrawal_token.lower(), 18)
+            token_decimals = await self.web3_helper.get_token_decimals(withdrawal_token)
             normalized_amount = withdrawal_amount_paid / Decimal(10 ** token_decimals)
             
             await self._approve_token_if_needed(
@@ -281,9 +282,7 @@ class MarketMakerWeb3Client:
             
             # Step 1: Approve Market Maker contract to spend withdrawal tokens
             # Convert back to normalized units for approval
-            token_decimals = TOKEN_DECIMALS.get(
-                self.network.value, {}
-            ).get(withdrawal_token.lower(), 18)
+            token_decimals = await self.web3_helper.get_token_decimals(withdrawal_token)
             normalized_amount = withdrawal_amount_paid / Decimal(10 ** token_decimals)
             
             await self._approve_token_if_needed(
@@ -359,12 +358,8 @@ class MarketMakerWeb3Client:
             )
             
             # Convert amounts to smallest units
-            deposit_decimals = TOKEN_DECIMALS.get(
-                self.network.value, {}
-            ).get(deposit_token.lower(), 18)
-            withdraw_decimals = TOKEN_DECIMALS.get(
-                self.network.value, {}
-            ).get(withdraw_token.lower(), 18)
+            deposit_decimals = await self.web3_helper.get_token_decimals(deposit_token)
+            withdraw_decimals = await self.web3_helper.get_token_decimals(withdraw_token)
             
             deposit_wei = int(deposit_amount * Decimal(10 ** deposit_decimals))
             withdraw_wei = int(withdraw_amount * Decimal(10 ** withdraw_decimals))
@@ -595,9 +590,7 @@ class MarketMakerWeb3Client:
             )
             
             # Wait for confirmation
-            receipt = await self.web3_helper.w3.eth.wait_for_transaction_receipt(
-                tx_hash, timeout=300
-            )
+            receipt = await self.web3_helper.wait_for_receipt(tx_hash, timeout=300)
             
             if receipt["status"] != 1:
                 raise TransactionFailedException(
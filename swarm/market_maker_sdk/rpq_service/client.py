@@ -2,10 +2,13 @@
 
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
+import httpx
+
 from swarm.shared.base_client import BaseAPIClient, APIException
+from swarm.shared.ratelimit import RateLimiter, rate_limited
 from swarm.shared.models import Quote
 from .models import (
     Offer,
@@ -57,14 +60,23 @@ class RPQClient(BaseAPIClient):
     
     BASE_URL = "https://rfq.swarm.com/v1/client"
     
-    def __init__(self, network: str = "polygon", api_key: Optional[str] = None):
+    def __init__(
+        self,
+        network: str = "polygon",
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """Initialize RPQ client.
         
         Args:
             network: Network name (polygon, base, ethereum). Default: polygon
             api_key: API key for authentication (required for some endpoints)
+            rate_limiter: Optional rate limiter; when set, requests are shaped by
+                the service's rate-limit headers and 429s are retried with back-off
+            transport: Optional shared HTTP connection pool (not closed by close())
         """
-        super().__init__(base_url=self.BASE_URL)
+        super().__init__(base_url=self.BASE_URL, rate_limiter=rate_limiter, transport=transport)
         self.network = network
         self.api_key = api_key
         
@@ -72,6 +84,7 @@ class RPQClient(BaseAPIClient):
         if api_key:
             self._headers["X-API-Key"] = api_key
     
+    @rate_limited
     async def get_offers(
         self,
         buy_asset_address: Optional[str] = None,
@@ -145,12 +158,14 @@ class RPQClient(BaseAPIClient):
                 raise RPQServiceException("Monthly rate limit reached") from e
             raise RPQServiceException(f"Failed to get offers: {e}") from e
     
+    @rate_limited
     async def get_best_offers(
         self,
         buy_asset_address: str,
         sell_asset_address: str,
         target_sell_amount: Optional[str] = None,
         target_buy_amount: Optional[str] = None,
+        only_best: bool = False,
     ) -> BestOffersResponse:
         """Get the best sequence of offers to reach a target amount.
         
@@ -162,6 +177,8 @@ class RPQClient(BaseAPIClient):
             sell_asset_address: Address of asset to sell (give up)
             target_sell_amount: Target amount to sell in normal decimal units (optional)
             target_buy_amount: Target amount to buy in normal decimal units (optional)
+            only_best: Only parse the first (best) selected offer; the rest of the
+                list is skipped. Default: False
         
         Returns:
             BestOffersResponse with selected offers and amounts
@@ -210,8 +227,12 @@ class RPQClient(BaseAPIClient):
                 )
             
             # Parse selected offers
+            offers_data = result_data.get("selectedOffers", [])
+            if only_best:
+                offers_data = offers_data[:1]
+            
             selected_offers = []
-            for offer_dict in result_data.get("selectedOffers", []):
+            for offer_dict in offers_data:
                 selected_offer = SelectedOffer(
                     id=offer_dict["id"],
                     withdrawal_amount_paid=offer_dict["withdrawalAmountPaid"],
@@ -249,6 +270,7 @@ class RPQClient(BaseAPIClient):
                 raise RPQServiceException(f"Invalid request parameters: {e.message}") from e
             raise RPQServiceException(f"Failed to get best offers: {e}") from e
     
+    @rate_limited
     async def _request_quote(self, quote_request: QuoteRequest) -> QuoteResponse:
         """Get a raw quote from RPQ API.
         
@@ -321,6 +343,7 @@ class RPQClient(BaseAPIClient):
                 raise RPQServiceException("Monthly rate limit reached") from e
             raise RPQServiceException(f"Failed to get quote: {e}") from e
     
+    @rate_limited
     async def get_price_feeds(self) -> PriceFeedsResponse:
         """Get all available price feeds for the network.
         
@@ -501,5 +524,5 @@ class RPQClient(BaseAPIClient):
             buy_amount=buy_amount,
             rate=rate,
             source="Market Maker RPQ",
-            timestamp=datetime.now(),  # Use current time since API doesn't return it
+            timestamp=datetime.now(timezone.utc),  # Use current time since API doesn't return it
         )
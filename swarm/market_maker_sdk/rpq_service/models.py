@@ -143,15 +143,29 @@ class SelectedOffer:
         price_per_unit: Price per unit (deposit tokens per withdrawal token, in wei)
         pricing_type: Fixed or Dynamic pricing
         deposit_to_withdrawal_rate: Exchange rate for dynamic offers (optional, in withdrawal token decimals)
+    
+    Numeric fields are parsed once at construction (the API returns them as
+    strings), so callers can use them directly in arithmetic.
     """
     id: str
-    withdrawal_amount_paid: str
-    withdrawal_amount_paid_decimals: str
+    withdrawal_amount_paid: int
+    withdrawal_amount_paid_decimals: int
     offer_type: OfferType
     maker: str
-    price_per_unit: str
+    price_per_unit: Decimal
     pricing_type: PricingType
-    deposit_to_withdrawal_rate: Optional[str] = None
+    deposit_to_withdrawal_rate: Optional[Decimal] = None
+    
+    def __post_init__(self):
+        if not isinstance(self.withdrawal_amount_paid, int):
+            self.withdrawal_amount_paid = int(Decimal(self.withdrawal_amount_paid))
+        self.withdrawal_amount_paid_decimals = int(self.withdrawal_amount_paid_decimals)
+        if not isinstance(self.price_per_unit, Decimal):
+            self.price_per_unit = Decimal(self.price_per_unit)
+        if self.deposit_to_withdrawal_rate is not None and not isinstance(
+            self.deposit_to_withdrawal_rate, Decimal
+        ):
+            self.deposit_to_withdrawal_rate = Decimal(self.deposit_to_withdrawal_rate)
 
 
 @dataclass
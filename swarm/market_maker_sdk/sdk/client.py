@@ -1,15 +1,18 @@
 """Core Market Maker SDK combining RPQ Service and Web3 operations."""
 
 import asyncio
-from typing import Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
+import httpx
+
 from swarm.shared.models import Network, Quote, TradeResult
-from swarm.shared.swarm_auth import SwarmAuth
+from swarm.shared.swarm_auth import SwarmAuth, TokenStorageInterface
 from swarm.shared.config import get_is_dev
 from swarm.shared.remote_config import close_config_fetchers
+from swarm.shared.ratelimit import RateLimiter
 from ..rpq_service import (
     RPQClient,
     NoOffersAvailableException,
@@ -57,6 +60,12 @@ class MarketMakerClient:
         >>> await client.close()
     """
     
+    # Maximum number of concurrent RPQ requests issued by get_quotes_batch()
+    QUOTE_BATCH_CONCURRENCY = 64
+    
+    # Stored tokens expiring within this many seconds are not reused
+    AUTH_EXPIRY_LEEWAY_SECONDS = 30
+    
     def __init__(
         self,
         network: Network,
@@ -64,6 +73,8 @@ class MarketMakerClient:
         rpq_api_key: str,
         user_email: Optional[str] = None,
         rpc_url: Optional[str] = None,
+        token_storage: Optional[TokenStorageInterface] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize Market Maker client.
         
@@ -73,16 +84,20 @@ class MarketMakerClient:
             rpq_api_key: API key for RPQ Service
             user_email: Optional email for authentication
             rpc_url: Optional custom RPC URL
+            token_storage: Optional token storage (default: in-memory). Pass a
+                FileTokenStorage to reuse valid tokens across processes.
+            transport: Optional HTTP connection pool shared with other clients.
+                It is not closed by close(); the caller owns it.
         """
         self.network = network
         
-        # Convert Network enum to string for RPQ client
-        network_name = network.name.lower()  # POLYGON -> "polygon"
-        
-        # Initialize RPQ client
+        # Initialize RPQ client (expects the network slug, e.g. "polygon").
+        # The rate limiter paces requests to the service's rate-limit headers.
         self.rpq_client = RPQClient(
-            network=network_name,
+            network=network.slug,
             api_key=rpq_api_key,
+            rate_limiter=RateLimiter(),
+            transport=transport,
         )
         
         # Initialize Web3 client
@@ -93,13 +108,17 @@ class MarketMakerClient:
         )
         
         # Initialize auth
-        self.auth = SwarmAuth()
+        self.auth = SwarmAuth(storage=token_storage, transport=transport)
         self.user_email = user_email
         
+        self._closed = False
+        self._close_lock = asyncio.Lock()
+        
         logger.info(
-            f"Initialized Market Maker client for network {network.name} "
-            f"({'dev' if get_is_dev() else 'prod'} mode) "
-            f"with account {self.web3_client.account.address}"
+            "Initialized Market Maker client for network %s (%s mode) with account %s",
+            network.name,
+            "dev" if get_is_dev() else "prod",
+            self.web3_client.account.address,
         )
     
     async def __aenter__(self):
@@ -115,10 +134,17 @@ class MarketMakerClient:
         """Authenticate with Swarm platform.
         
         Uses the wallet's private key to sign authentication message.
+        Skipped when the token storage already holds a token for this wallet
+        that is valid for at least AUTH_EXPIRY_LEEWAY_SECONDS.
         
         Raises:
             AuthenticationError: If authentication fails
         """
+        stored = self.auth.load_tokens(self.web3_client.account.address)
+        if stored is not None and not stored.is_expired(leeway=self.AUTH_EXPIRY_LEEWAY_SECONDS):
+            logger.info("Reusing stored Swarm auth token (expires at %s)", stored.expires_at)
+            return
+        
         logger.info("Authenticating with Swarm platform")
         
         # Verify with the Web3Client's account (LocalAccount)
@@ -127,14 +153,25 @@ class MarketMakerClient:
         logger.info("Successfully authenticated with Swarm platform")
     
     async def close(self):
-        """Close all clients and cleanup resources."""
-        if hasattr(self.rpq_client, 'close'):
-            await self.rpq_client.close()
-        
-        # Close remote config fetcher sessions
-        await close_config_fetchers()
+        """Close all clients and cleanup resources.
         
-        logger.info("Market Maker client closed")
+        Safe to call more than once or concurrently; only the first call
+        does any work, and later callers wait for it to finish.
+        """
+        async with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+            if hasattr(self.rpq_client, 'close'):
+                await self.rpq_client.close()
+            
+            await self.web3_client.close()
+            
+            # Close remote config fetcher sessions
+            await close_config_fetchers()
+            
+            logger.info("Market Maker client closed")
     
     async def get_quote(
         self,
@@ -175,6 +212,58 @@ class MarketMakerClient:
             target_buy_amount=str(to_amount) if to_amount else None,
         )
     
+    async def get_quotes_batch(
+        self,
+        pairs: List[Tuple[str, str, Optional[Decimal], Optional[Decimal]]],
+        max_concurrency: int = QUOTE_BATCH_CONCURRENCY,
+    ) -> List[Quote]:
+        """Get quotes for several token pairs concurrently.
+        
+        The RPQ Service has no batch endpoint, so quotes are requested in parallel
+        with at most ``max_concurrency`` requests in flight at a time. The first
+        failure is raised and the requests still pending are cancelled.
+        
+        Args:
+            pairs: Tuples of (from_token, to_token, from_amount, to_amount).
+                Provide either from_amount OR to_amount in each tuple.
+            max_concurrency: Maximum number of concurrent RPQ requests
+        
+        Returns:
+            Quotes in the same order as ``pairs``
+        
+        Raises:
+            NoOffersAvailableException: If no offers available for a pair
+            ValueError: If both or neither amounts provided for a pair
+        
+        Example:
+            >>> quotes = await client.get_quotes_batch([
+            ...     ("0xUSDC...", "0xRWA1...", Decimal("100"), None),
+            ...     ("0xUSDC...", "0xRWA2...", None, Decimal("5")),
+            ... ])
+            >>> for quote in quotes:
+            ...     print(f"{quote.buy_token_address}: {quote.buy_amount}")
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _get_quote(
+            from_token: str,
+            to_token: str,
+            from_amount: Optional[Decimal],
+            to_amount: Optional[Decimal],
+        ) -> Quote:
+            async with semaphore:
+                return await self.get_quote(from_token, to_token, from_amount, to_amount)
+        
+        tasks = [asyncio.create_task(_get_quote(*pair)) for pair in pairs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            # On the first failure (or cancellation) stop the remaining requests
+            # instead of leaving them running against the RPQ Service
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def trade(
         self,
         from_token: str,
@@ -223,9 +312,7 @@ class MarketMakerClient:
             >>> print(f"Trade successful! TX: {result.tx_hash}")
         """
         try:
-            logger.info(
-                f"Starting Market Maker trade: {from_token} -> {to_token}"
-            )
+            logger.info("Starting Market Maker trade: %s -> %s", from_token, to_token)
             
             # Step 1: Get best offers - now includes depositToWithdrawalRate in SelectedOffer
             best_offers_response = await self.rpq_client.get_best_offers(
@@ -233,6 +320,7 @@ class MarketMakerClient:
                 sell_asset_address=from_token,   # withdrawalAsset - what we'll pay
                 target_sell_amount=str(from_amount) if from_amount else None,
                 target_buy_amount=str(to_amount) if to_amount else None,
+                only_best=True,
             )
             
             if not best_offers_response.result.selected_offers:
@@ -240,34 +328,28 @@ class MarketMakerClient:
                     "No suitable offers found for this trade"
                 )
             
-            # Use the first selected offer (best one) - it now has all the data we need
+            # Use the first selected offer (best one) - the only one parsed
             selected_offer = best_offers_response.result.selected_offers[0]
             
             logger.info(
-                f"Found best offer {selected_offer.id}: "
-                f"Paying {selected_offer.withdrawal_amount_paid} at price {selected_offer.price_per_unit}"
+                "Found best offer %s: Paying %s at price %s",
+                selected_offer.id,
+                selected_offer.withdrawal_amount_paid,
+                selected_offer.price_per_unit,
             )
             
-            # Get token decimals for normalization
-            withdrawal_decimals = int(selected_offer.withdrawal_amount_paid_decimals)
-            deposit_decimals = self.web3_client.web3_helper._get_token_decimals(to_token)
-            
-            # Amount to pay in smallest units (wei) - for on-chain transaction
-            withdrawal_amount_paid_wei = Decimal(selected_offer.withdrawal_amount_paid)
-            
-            # Normalize withdrawal amount: wei / (10 ** decimals)
-            withdrawal_amount_paid_normalized = withdrawal_amount_paid_wei / Decimal(10 ** withdrawal_decimals)
+            # Amount to pay in smallest units (wei) - sent on-chain as-is
+            withdrawal_amount_paid_wei = selected_offer.withdrawal_amount_paid
             
             # Step 2: Execute trade on-chain based on pricing type
             if selected_offer.pricing_type == PricingType.DYNAMIC_PRICING:
                 # For dynamic offers, use depositToWithdrawalRate from SelectedOffer for slippage protection
-                if not selected_offer.deposit_to_withdrawal_rate:
+                max_rate = selected_offer.deposit_to_withdrawal_rate
+                if max_rate is None:
                     raise MarketMakerWeb3Exception(
                         f"Dynamic offer {selected_offer.id} missing depositToWithdrawalRate"
                     )
                 
-                max_rate = Decimal(selected_offer.deposit_to_withdrawal_rate)
-                
                 tx_hash = await self.web3_client.take_offer_dynamic(
                     offer_id=selected_offer.id,
                     withdrawal_token=from_token,
@@ -283,11 +365,18 @@ class MarketMakerClient:
                     affiliate=affiliate,
                 )
             
+            # Normalized amounts are for display only, so they are derived after the
+            # on-chain call. Shifting the exponent of the wei value is exact and
+            # avoids a Decimal division by 10 ** decimals.
+            withdrawal_amount_paid_normalized = Decimal(withdrawal_amount_paid_wei).scaleb(
+                -selected_offer.withdrawal_amount_paid_decimals
+            )
+            
             # Calculate amount received:
             # price_per_unit is how much withdrawal token (USDC) you pay per 1 deposit token (RWA)
             # So: deposit_amount = withdrawal_amount / price_per_unit
             # Example: If 1 RWA costs 186.555 USDC, then 1 USDC buys 1/186.555 = 0.00536 RWA
-            price_per_unit = Decimal(selected_offer.price_per_unit)
+            price_per_unit = selected_offer.price_per_unit
             
             # Calculate deposit amount: how much RWA we receive for the USDC we're paying
             deposit_amount_received_normalized = withdrawal_amount_paid_normalized / price_per_unit if price_per_unit > 0 else Decimal("0")
@@ -302,13 +391,11 @@ class MarketMakerClient:
                 buy_amount=deposit_amount_received_normalized,
                 rate=price_per_unit,
                 source="market_maker",
-                timestamp=datetime.now(),
+                timestamp=datetime.now(timezone.utc),
                 network=self.network,
             )
             
-            logger.info(
-                f"Market Maker trade completed successfully! TX: {tx_hash}"
-            )
+            logger.info("Market Maker trade completed successfully! TX: %s", tx_hash)
             
             return result
             
@@ -357,8 +444,11 @@ class MarketMakerClient:
             >>> print(f"Offer created! ID: {result.order_id}")
         """
         logger.info(
-            f"Creating Market Maker offer: {sell_amount} {sell_token} -> "
-            f"{buy_amount} {buy_token}"
+            "Creating Market Maker offer: %s %s -> %s %s",
+            sell_amount,
+            sell_token,
+            buy_amount,
+            buy_token,
         )
         
         tx_hash, offer_id = await self.web3_client.make_offer(
@@ -382,11 +472,11 @@ class MarketMakerClient:
             buy_amount=buy_amount,
             rate=rate,
             source="market_maker",
-            timestamp=datetime.now(),
+            timestamp=datetime.now(timezone.utc),
             network=self.network,
         )
         
-        logger.info(f"Offer created successfully! ID: {offer_id}, TX: {tx_hash}")
+        logger.info("Offer created successfully! ID: %s, TX: %s", offer_id, tx_hash)
         
         return result
     
@@ -408,10 +498,10 @@ class MarketMakerClient:
         Example:
             >>> tx_hash = await client.cancel_offer(offer_id="12345")
         """
-        logger.info(f"Cancelling offer {offer_id}")
+        logger.info("Cancelling offer %s", offer_id)
         
         tx_hash = await self.web3_client.cancel_offer(offer_id)
         
-        logger.info(f"Offer cancelled successfully! TX: {tx_hash}")
+        logger.info("Offer cancelled successfully! TX: %s", tx_hash)
         
         return tx_hash
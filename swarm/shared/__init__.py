@@ -1,12 +1,14 @@
 """Shared package for Swarm Collection SDKs."""
 
-from .models import Network, Quote, TradeResult
+from .models import Network, Quote, TradeResult, GasEstimate, TokenTransfer
 from .base_client import BaseAPIClient, APIException
-from .constants import USDC_ADDRESSES, TOKEN_DECIMALS
+from .ratelimit import RateLimiter
+from .constants import USDC_ADDRESSES, TOKEN_DECIMALS, TOKEN_DECIMALS_BY_ADDRESS
 from .swarm_auth import (
     SwarmAuth,
     AuthTokens,
     InMemoryStorage,
+    FileTokenStorage,
     TokenStorageInterface,
     SigningTimeoutError,
     AuthenticationError,
@@ -25,16 +27,21 @@ __all__ = [
     "Network",
     "Quote", 
     "TradeResult",
+    "GasEstimate",
+    "TokenTransfer",
     # Base client
     "BaseAPIClient",
     "APIException",
+    "RateLimiter",
     # Constants
     "USDC_ADDRESSES",
     "TOKEN_DECIMALS",
+    "TOKEN_DECIMALS_BY_ADDRESS",
     # Authentication
     "SwarmAuth",
     "AuthTokens",
     "InMemoryStorage",
+    "FileTokenStorage",
     "TokenStorageInterface",
     "SigningTimeoutError",
     "AuthenticationError",
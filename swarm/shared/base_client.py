@@ -4,28 +4,90 @@ import logging
 from typing import Dict, Any, Optional
 import httpx
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
+    wait_random,
 )
 
+from .ratelimit import RateLimiter, parse_retry_after
+from .serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
 class APIException(Exception):
     """Base API exception."""
     
-    def __init__(self, status_code: int = 0, message: str = "API request failed"):
+    def __init__(
+        self,
+        status_code: int = 0,
+        message: str = "API request failed",
+        retry_after: Optional[float] = None,
+    ):
         self.status_code = status_code
+        self.retry_after = retry_after
         self.message = f"{message} (status: {status_code})" if status_code else message
         super().__init__(self.message)
 
 
+# Longest Retry-After that is waited out before retrying
+_MAX_RETRY_AFTER = 10.0
+
+_default_wait = wait_exponential(multiplier=1, min=2, max=10) + wait_random(0, 1)
+
+
+def _is_retryable(retry_state: RetryCallState) -> bool:
+    """Whether _make_request should retry after the attempt in ``retry_state``.
+
+    Transport failures (status 0) and 5xx responses are retried; other 4xx
+    responses are not. A 429 is retried only by clients without a RateLimiter,
+    since clients that opt into one back off on it there instead. Any response
+    whose Retry-After exceeds ``_MAX_RETRY_AFTER`` (e.g. an exhausted quota or
+    a long maintenance window) is raised immediately.
+    """
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, APIException):
+        if exc.retry_after is not None and exc.retry_after > _MAX_RETRY_AFTER:
+            return False
+        if exc.status_code == 429:
+            return retry_state.args[0].rate_limiter is None
+        return not exc.status_code or exc.status_code >= 500
+    return isinstance(exc, httpx.HTTPError)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait for the response's Retry-After if given, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, APIException) and exc.retry_after is not None:
+        return min(exc.retry_after, _MAX_RETRY_AFTER)
+    return _default_wait(retry_state)
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Wrap a transport shared between clients, leaving its closing to the owner."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
 class BaseAPIClient:
     """Base client for making HTTP requests with retry logic."""
 
-    def __init__(self, base_url: str, auth_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         print(f"------- {base_url}")
         """
         Initialize base API client.
@@ -33,9 +95,14 @@ class BaseAPIClient:
         Args:
             base_url: Base URL for API requests
             auth_token: Optional authentication token for API requests
+            rate_limiter: Optional rate limiter fed from response rate-limit headers
+            transport: Optional connection pool shared with other clients; it is
+                left open by close() and must be closed by whoever created it
         """
         self.base_url = base_url
         self.auth_token = auth_token
+        self.rate_limiter = rate_limiter
+        self._transport = _BorrowedTransport(transport) if transport is not None else None
         self._client: Optional[httpx.AsyncClient] = None
         self._headers = {
             "Content-Type": "application/json",
@@ -59,6 +126,7 @@ class BaseAPIClient:
                 headers=self._headers,
                 timeout=30.0,
                 follow_redirects=True,
+                transport=self._transport,
             )
 
     async def close(self):
@@ -76,8 +144,8 @@ class BaseAPIClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, APIException)),
+        wait=_retry_wait,
+        retry=_is_retryable,
         reraise=True,
     )
     async def _make_request(
@@ -110,14 +178,18 @@ class BaseAPIClient:
             response = await self._client.request(
                 method=method,
                 url=url,
-                json=data,
+                content=dumps(data) if data is not None else None,
                 params=params,
             )
             
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(response.headers)
+            
             # Raise for HTTP errors
             response.raise_for_status()
             
-            return response.json()
+            # Decode the raw body directly (httpx has already decompressed it)
+            return loads(response.content)
             
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e}")
@@ -127,7 +199,11 @@ class BaseAPIClient:
                 error_message = error_data.get("message", str(e))
             except:
                 error_message = str(e)
-            raise APIException(status_code=status_code, message=error_message)
+            raise APIException(
+                status_code=status_code,
+                message=error_message,
+                retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+            )
             
         except httpx.HTTPError as e:
             logger.error(f"Request error: {e}")
@@ -131,7 +131,7 @@ async def get_dotc_manager_address(chain_id: int) -> str:
         >>> print(f"Market Maker Manager: {address}")
     """
     fetcher = await get_config_fetcher(is_dev=get_is_dev())
-    return fetcher.get_dotc_manager_address(chain_id)
+    return fetcher.get_market_maker_manager_address(chain_id)
 
 # Environment info (for debugging/logging)
 async def get_environment_info() -> Dict[str, str]:
@@ -4,6 +4,8 @@ This module contains static addresses and configuration that do NOT vary by envi
 For environment-dependent values (dev/prod), see shared/config.py instead.
 """
 
+from typing import Dict, Tuple
+
 from .models import Network
 
 # USDC token addresses for different networks (static, not environment-dependent)
@@ -22,3 +24,22 @@ TOKEN_DECIMALS = {
     "WETH": 18,
     "WMATIC": 18,
 }
+
+# Decimals of well-known tokens keyed by (network, lowercase address), so hot
+# paths can skip the ERC-20 decimals() RPC call for them
+TOKEN_DECIMALS_BY_ADDRESS: Dict[Tuple[Network, str], int] = {
+    (Network.ETHEREUM, USDC_ADDRESSES[Network.ETHEREUM].lower()): 6,
+    (Network.POLYGON, USDC_ADDRESSES[Network.POLYGON].lower()): 6,
+    (Network.BASE, USDC_ADDRESSES[Network.BASE].lower()): 6,
+    # Binance-Peg USDC uses 18 decimals
+    (Network.BSC, USDC_ADDRESSES[Network.BSC].lower()): 18,
+    # USDT
+    (Network.ETHEREUM, "0xdac17f958d2ee523a2206206994597c13d831ec7"): 6,
+    (Network.POLYGON, "0xc2132d05d31c914a87c6611c10748aeb04b58e8f"): 6,
+    (Network.BSC, "0x55d398326f99059ff775485246999027b3197955"): 18,
+    # DAI
+    (Network.ETHEREUM, "0x6b175474e89094c44da98b954eedeac495271d0f"): 18,
+    (Network.POLYGON, "0x8f3cf7ad23cd3cadbd9735aff958023239c6a063"): 18,
+    (Network.BASE, "0x50c5725949a6f0c72e6c4a641f24049a917db0cb"): 18,
+    (Network.BSC, "0x1af3f329e8be154074d8769d1ffa4ee058b1dbc3"): 18,
+}
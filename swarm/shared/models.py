@@ -1,21 +1,41 @@
 """Shared models for Swarm Collection."""
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 
 
-class Network(Enum):
-    """Supported blockchain networks."""
+# Keyword arguments for @dataclass that drop the per-instance __dict__ where supported
+# (slots=True requires Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class Network(IntEnum):
+    """Supported blockchain networks (values are chain IDs)."""
     ETHEREUM = 1
     POLYGON = 137
     BASE = 8453
     BSC = 56
+    
+    @property
+    def slug(self) -> str:
+        """Lowercase network name used by Swarm APIs (e.g., "polygon")."""
+        return _NETWORK_SLUGS[self]
+
 
+# Lowercase network names, computed once instead of on every lookup
+_NETWORK_SLUGS = {
+    Network.ETHEREUM: "ethereum",
+    Network.POLYGON: "polygon",
+    Network.BASE: "base",
+    Network.BSC: "bsc",
+}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Quote:
     """
     Unified quote model for trading services.
@@ -31,7 +51,7 @@ class Quote:
     buy_amount: Decimal       # Amount to receive (normalized)
     rate: Decimal             # Exchange rate (buy_amount / sell_amount)
     source: str               # Service that provided quote ("cross_chain_access" or "market_maker")
-    timestamp: datetime       # When quote was generated
+    timestamp: datetime       # When quote was generated (UTC)
     
     @property
     def price_per_unit(self) -> Decimal:
@@ -65,7 +85,7 @@ class Quote:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TradeResult:
     """
     Result of a completed trade.
@@ -81,7 +101,7 @@ class TradeResult:
     buy_amount: Decimal           # Actual amount received (normalized)
     rate: Decimal                 # Execution rate
     source: str                   # Service used ("cross_chain_access" or "market_maker")
-    timestamp: datetime           # Execution timestamp
+    timestamp: datetime           # Execution timestamp (UTC)
     network: Network              # Blockchain network
     status: str = "completed"     # Trade status
     
@@ -93,3 +113,19 @@ class TradeResult:
             f"on {self.network.name} "
             f"(tx: {self.tx_hash[:10]}...)"
         )
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class GasEstimate:
+    """Gas estimate for a token transfer."""
+    gas_limit: int                # Gas limit, including the safety buffer
+    gas_price: int                # Gas price in wei (max fee per gas on EIP-1559 networks)
+    gas_cost: Decimal             # gas_limit * gas_price in native token units
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class TokenTransfer:
+    """A single ERC20 transfer, as passed to Web3Helper.batch_transfer()."""
+    to_address: str               # Recipient address
+    token_address: str            # Token contract address
+    amount: Decimal               # Amount to transfer (normalized)
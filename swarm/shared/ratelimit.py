@@ -0,0 +1,223 @@
+"""Client-side rate limiting driven by server rate-limit headers."""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# X-RateLimit-Reset values above this are absolute Unix timestamps, not deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, returning None if missing or malformed."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Non-negative delay in seconds, or None if missing or malformed
+    """
+    seconds = _parse_seconds(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    if not value:
+        return None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Adaptive client-side rate limiter.
+
+    Bounds the number of in-flight requests and narrows that bound to what the
+    server reports as remaining in the current window (``X-RateLimit-Remaining``).
+    When the window is exhausted, or the server answers 429, new requests are
+    held back until ``X-RateLimit-Reset`` / ``Retry-After`` has elapsed instead
+    of piling more requests onto the quota.
+
+    Attributes:
+        max_concurrency: Upper bound on concurrent requests
+        max_retries: Maximum retries after a 429 response
+        base_delay: Initial back-off delay in seconds
+        max_delay: Maximum back-off delay in seconds
+        jitter: Maximum random jitter added to each back-off, in seconds
+
+    Example:
+        >>> limiter = RateLimiter(max_concurrency=8)
+        >>> async with limiter:
+        ...     response = await client.get(...)
+        ...     limiter.observe(response.headers)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_concurrency: Upper bound on concurrent requests (default: 16)
+            max_retries: Maximum retries after a 429 response (default: 4)
+            base_delay: Initial back-off delay in seconds (default: 0.5)
+            max_delay: Maximum back-off delay in seconds (default: 30)
+            jitter: Maximum random jitter per back-off in seconds (default: 0.5)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._resume_at = 0.0
+        # Created lazily so it binds to the running event loop
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Update the limiter from a response's rate-limit headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        remaining = _parse_seconds(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+
+        self._limit = max(1, min(self.max_concurrency, int(remaining)))
+
+        if remaining <= 0:
+            reset = _parse_seconds(headers.get("X-RateLimit-Reset"))
+            if reset is not None:
+                if reset > _EPOCH_THRESHOLD:
+                    reset -= time.time()
+                self.defer(reset)
+
+    def defer(self, seconds: float) -> None:
+        """Hold back new requests for ``seconds``.
+
+        Args:
+            seconds: Delay before the next request may start
+        """
+        if seconds > 0:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute the delay before retry number ``attempt``.
+
+        Args:
+            attempt: Zero-based retry attempt
+            retry_after: Server-provided Retry-After delay, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay + random.random() * self.jitter
+
+    async def __aenter__(self) -> "RateLimiter":
+        """Acquire a request slot, waiting for capacity and any back-off."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the request slot."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+def _find_rate_limit_error(exc: Optional[BaseException]) -> Optional[BaseException]:
+    """Return the HTTP 429 error in an exception's cause chain, if any."""
+    while exc is not None:
+        if getattr(exc, "status_code", None) == 429:
+            return exc
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def rate_limited(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Decorate an API client method with rate limiting and 429 retries.
+
+    The decorated method's instance must expose a ``rate_limiter`` attribute.
+    When it is None the method is called directly. Otherwise each call holds a
+    limiter slot, and a 429 response anywhere in the raised exception's cause
+    chain is retried after ``Retry-After`` or an exponential back-off with
+    jitter. A Retry-After longer than the limiter's ``max_delay`` (e.g. an
+    exhausted monthly quota) is raised immediately.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        limiter: Optional[RateLimiter] = self.rate_limiter
+        if limiter is None:
+            return await func(self, *args, **kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                async with limiter:
+                    return await func(self, *args, **kwargs)
+            except Exception as e:
+                error = _find_rate_limit_error(e)
+                if error is None or attempt >= limiter.max_retries:
+                    raise
+                delay = limiter.backoff(attempt, getattr(error, "retry_after", None))
+                if delay > limiter.max_delay:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "%s rate limited, retrying in %.2fs (attempt %d/%d)",
+                    func.__qualname__,
+                    delay,
+                    attempt,
+                    limiter.max_retries,
+                )
+                limiter.defer(delay)
+
+    return wrapper
@@ -1,7 +1,8 @@
 """Remote configuration fetcher with auto-refresh.
 
-This module fetches configuration from remote JSON files and caches them 
-with automatic refresh every 5 minutes.
+This module fetches configuration from remote JSON files and caches them.
+A background task refreshes the cache every 5 minutes, so lookups never
+perform I/O.
 
 Configuration includes:
 - Topup/escrow addresses for Cross-Chain Access
@@ -10,10 +11,14 @@ Configuration includes:
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import time
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+from datetime import datetime, timedelta, timezone
 import aiohttp
 
+from .serialization import loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +27,8 @@ class RemoteConfigFetcher:
     
     Loads configuration from remote URL: https://trading-configurations.swarm.com/
     
-    Configuration is cached and refreshed every 5 minutes automatically.
+    Configuration is cached and refreshed every 5 minutes by a background task
+    started in initialize(), so accessors are plain in-memory lookups.
     
     Attributes:
         is_dev: Whether running in development mode
@@ -41,6 +47,22 @@ class RemoteConfigFetcher:
     # Default refresh interval: 5 minutes
     REFRESH_INTERVAL_SECONDS = 5 * 60
     
+    # Timeout for a single config download
+    _FETCH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+    
+    __slots__ = (
+        "is_dev",
+        "cache",
+        "last_fetch",
+        "refresh_interval",
+        "config_url",
+        "_refresh_deadline",
+        "_in_flight",
+        "_refresh_task",
+        "_topup_address",
+        "_mm_manager_by_chain",
+    )
+    
     def __init__(self, is_dev: bool = False):
         """Initialize remote config fetcher.
         
@@ -49,10 +71,15 @@ class RemoteConfigFetcher:
         """
         self.is_dev = is_dev
         self.cache: Optional[Dict[str, Any]] = None
-        self.last_fetch: Optional[datetime] = None
+        self.last_fetch: Optional[datetime] = None  # For display only
+        self._refresh_deadline = 0.0  # time.monotonic() at which the cache goes stale
         self.refresh_interval = timedelta(seconds=self.REFRESH_INTERVAL_SECONDS)
-        self._fetch_lock = asyncio.Lock()
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._in_flight: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Lookup tables flattened from the cache on every successful fetch
+        self._topup_address: Optional[str] = None
+        self._mm_manager_by_chain: Dict[int, str] = {}
         
         # Remote URLs
         dev_url = "https://swarm-sdk-configurations.s3.eu-central-1.amazonaws.com/config.dev.json"
@@ -68,7 +95,8 @@ class RemoteConfigFetcher:
     async def initialize(self):
         """Initialize the config fetcher and load initial configuration.
         
-        This should be called once during application startup.
+        This should be called once during application startup. On success it
+        starts the background refresh task.
         
         Raises:
             Exception: If configuration cannot be loaded from remote
@@ -85,31 +113,90 @@ class RemoteConfigFetcher:
             f"Configuration loaded successfully "
             f"(version: {self.cache.get('version', 'unknown')})"
         )
+        
+        self._start_refresh_task()
+    
+    def _start_refresh_task(self, refresh_now: bool = False):
+        """Start the background refresh task unless it is already running.
+        
+        Args:
+            refresh_now: Fetch immediately instead of after one refresh interval
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop(refresh_now))
     
     async def close(self):
-        """Close HTTP session and cleanup resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Stop the background refresh task.
+        
+        The HTTP session is shared by all fetchers and closed by
+        close_config_fetchers().
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        
+        if self._in_flight is not None and not self._in_flight.done():
+            # Wait for the fetch to stop before the shared session is closed
+            self._in_flight.cancel()
+            try:
+                await self._in_flight
+            except asyncio.CancelledError:
+                pass
+        self._in_flight = None
     
     async def _fetch_config(self) -> bool:
         """Fetch configuration from remote URL.
         
+        Concurrent calls are coalesced onto a single in-flight fetch
+        (single-flight), so a burst of refreshes makes one HTTP request and
+        every caller sees its result.
+        
         Returns:
             True if fetch was successful, False otherwise
         """
-        async with self._fetch_lock:
-            try:
-                config = await self._fetch_from_url(self.config_url)
-                if config:
-                    self.cache = config
-                    self.last_fetch = datetime.utcnow()
-                    logger.info(f"Configuration fetched from remote: {self.config_url}")
-                    return True
-            except Exception as e:
-                logger.error(f"Failed to fetch from remote: {e}")
-            
-            return False
+        if self._in_flight is None or self._in_flight.done():
+            self._in_flight = asyncio.create_task(self._fetch_config_once())
+        # Shielded so a cancelled waiter does not abort the fetch for the others
+        return await asyncio.shield(self._in_flight)
+    
+    async def _fetch_config_once(self) -> bool:
+        """Fetch configuration once and swap it into the cache.
+        
+        On success the address lookup tables are rebuilt from the new config, so
+        accessors are a single attribute or dict read.
+        
+        Returns:
+            True if fetch was successful, False otherwise
+        """
+        try:
+            config = await self._fetch_from_url(self.config_url)
+            if config:
+                topup_address = config.get("topup_addresses", {}).get(
+                    "cross_chain_access_escrow"
+                )
+                mm_manager_by_chain = {
+                    int(chain_id): address
+                    for chain_id, address in config.get("dotc_manager_addresses", {}).items()
+                    if address
+                }
+                
+                self.cache = config
+                self._topup_address = topup_address
+                self._mm_manager_by_chain = mm_manager_by_chain
+                self.last_fetch = datetime.now(timezone.utc)
+                self._refresh_deadline = (
+                    time.monotonic() + self.refresh_interval.total_seconds()
+                )
+                logger.info(f"Configuration fetched from remote: {self.config_url}")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to fetch from remote: {e}")
+        
+        return False
     
     async def _fetch_from_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Fetch configuration from remote URL.
@@ -120,36 +207,55 @@ class RemoteConfigFetcher:
         Returns:
             Configuration dictionary or None if fetch fails
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-        
-        async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        async with get_shared_session().get(url, timeout=self._FETCH_TIMEOUT) as response:
             if response.status == 200:
-                return await response.json()
+                # Parse the raw bytes directly; skips aiohttp's str decode + stdlib json
+                return loads(await response.read())
             else:
                 logger.warning(f"Remote config returned status {response.status}")
                 return None
     
-    async def _maybe_refresh(self):
-        """Refresh configuration if cache is stale.
+    async def _refresh_loop(self, refresh_now: bool = False):
+        """Refresh configuration every refresh interval until cancelled.
         
-        This is called automatically before accessing cached data.
+        The cache is replaced wholesale on success, so readers always see either
+        the previous or the new configuration. On failure the cached data is kept.
+        
+        Args:
+            refresh_now: Fetch once immediately before the first interval
         """
-        if not self.last_fetch:
-            # No initial fetch yet
-            await self._fetch_config()
-            return
-        
-        time_since_fetch = datetime.utcnow() - self.last_fetch
-        if time_since_fetch >= self.refresh_interval:
-            logger.info("Configuration cache is stale, refreshing...")
+        while True:
+            if not refresh_now:
+                await asyncio.sleep(self.refresh_interval.total_seconds())
+            refresh_now = False
             success = await self._fetch_config()
             if not success:
+                overdue = time.monotonic() - self._refresh_deadline
                 logger.warning(
                     "Failed to refresh configuration, using cached data "
-                    f"(age: {time_since_fetch.total_seconds():.0f}s)"
+                    f"(stale for {overdue:.0f}s)"
                 )
     
+    def _is_stale(self) -> bool:
+        """Check whether the cache is past its refresh interval and no
+        background refresh is running to update it.
+        
+        Synchronous and allocation-free, so it is cheap enough for every lookup.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return False
+        return time.monotonic() >= self._refresh_deadline
+    
+    def _revalidate(self):
+        """Restart background refresh for a stale cache (stale-while-revalidate).
+        
+        Callers keep reading the cached data while the refresh runs, so no
+        lookup ever waits on the network. Only needed when the refresh task has
+        stopped, e.g. because the event loop it ran on was shut down.
+        """
+        logger.info("Configuration cache is stale, refreshing in background...")
+        self._start_refresh_task(refresh_now=True)
+    
     def get_topup_address(self) -> str:
         """Get Cross-Chain Access escrow/topup address.
         
@@ -159,11 +265,10 @@ class RemoteConfigFetcher:
         Raises:
             ValueError: If configuration not loaded or address not found
         """
-        if not self.cache:
-            raise ValueError("Configuration not loaded. Call initialize() first.")
-        
-        address = self.cache.get("topup_addresses", {}).get("cross_chain_access_escrow")
+        address = self._topup_address
         if not address:
+            if not self.cache:
+                raise ValueError("Configuration not loaded. Call initialize() first.")
             raise ValueError("Topup address not found in configuration")
         
         return address
@@ -180,14 +285,14 @@ class RemoteConfigFetcher:
         Raises:
             ValueError: If configuration not loaded or address not found for chain
         """
-        if not self.cache:
-            raise ValueError("Configuration not loaded. Call initialize() first.")
-        
-        address = self.cache.get("dotc_manager_addresses", {}).get(str(chain_id))
-        if not address:
-            raise ValueError(f"Market Maker Manager address not found for chain ID {chain_id}")
-        
-        return address
+        try:
+            return self._mm_manager_by_chain[chain_id]
+        except KeyError:
+            if not self.cache:
+                raise ValueError("Configuration not loaded. Call initialize() first.") from None
+            raise ValueError(
+                f"Market Maker Manager address not found for chain ID {chain_id}"
+            ) from None
     
     def get_config_version(self) -> str:
         """Get configuration version.
@@ -199,18 +304,21 @@ class RemoteConfigFetcher:
             return "unknown"
         return self.cache.get("version", "unknown")
     
-    def get_all_config(self) -> Dict[str, Any]:
+    def get_all_config(self) -> Mapping[str, Any]:
         """Get entire configuration dictionary.
         
         Returns:
-            Configuration dictionary
+            Read-only view of the cached configuration. No copy is made;
+            refreshes replace the cache rather than mutate it, so the view
+            stays a consistent snapshot. Nested values are not copied either
+            and must not be modified.
         
         Raises:
             ValueError: If configuration not loaded
         """
         if not self.cache:
             raise ValueError("Configuration not loaded. Call initialize() first.")
-        return self.cache.copy()
+        return MappingProxyType(self.cache)
 
 
 # Global singleton instances
@@ -218,6 +326,42 @@ _prod_fetcher: Optional[RemoteConfigFetcher] = None
 _dev_fetcher: Optional[RemoteConfigFetcher] = None
 _fetcher_lock = asyncio.Lock()
 
+# HTTP session shared by both fetchers (same host), so refreshes reuse
+# keep-alive connections, TLS sessions and DNS results, and the event loop it
+# was created on (an aiohttp session can't be used from any other loop)
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Get or create the HTTP session shared by all config fetchers.
+    
+    Must be called from a running event loop. The session is closed by
+    close_config_fetchers(). It is rebuilt when called from a different loop,
+    e.g. after get_topup_address_sync() ran its own asyncio.run().
+    
+    Returns:
+        Shared aiohttp ClientSession
+    """
+    global _shared_session, _shared_session_loop
+    
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session_loop is not loop
+    ):
+        # A session left on another loop can't be closed from this one; drop it
+        _shared_session_loop = loop
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                keepalive_timeout=120,
+                ttl_dns_cache=300,
+            )
+        )
+    return _shared_session
+
 
 async def get_config_fetcher(is_dev: bool = False) -> RemoteConfigFetcher:
     """Get or create the global config fetcher singleton.
@@ -225,6 +369,9 @@ async def get_config_fetcher(is_dev: bool = False) -> RemoteConfigFetcher:
     Args:
         is_dev: Whether to use development configuration
     
+    The first call for each environment loads the configuration and starts its
+    background refresh task; later calls return the cached instance without I/O.
+    
     Returns:
         RemoteConfigFetcher instance
     
@@ -234,36 +381,56 @@ async def get_config_fetcher(is_dev: bool = False) -> RemoteConfigFetcher:
     """
     global _prod_fetcher, _dev_fetcher
     
+    # Fast path: once published, a fetcher is returned without taking the lock.
+    # The background task keeps it fresh; if it has stopped, restart it and
+    # serve the cached data meanwhile.
+    fetcher = _dev_fetcher if is_dev else _prod_fetcher
+    if fetcher is not None:
+        if fetcher._is_stale():
+            fetcher._revalidate()
+        return fetcher
+    
     async with _fetcher_lock:
+        # Re-check: another coroutine may have created it while we waited
+        fetcher = _dev_fetcher if is_dev else _prod_fetcher
+        if fetcher is not None:
+            return fetcher
+        
+        fetcher = RemoteConfigFetcher(is_dev=is_dev)
+        try:
+            await fetcher.initialize()
+        except Exception:
+            await fetcher.close()
+            raise
+        
+        # Publish only fully initialized fetchers
         if is_dev:
-            if _dev_fetcher is None:
-                _dev_fetcher = RemoteConfigFetcher(is_dev=True)
-                await _dev_fetcher.initialize()
-            else:
-                # Auto-refresh if needed
-                await _dev_fetcher._maybe_refresh()
-            return _dev_fetcher
+            _dev_fetcher = fetcher
         else:
-            if _prod_fetcher is None:
-                _prod_fetcher = RemoteConfigFetcher(is_dev=False)
-                await _prod_fetcher.initialize()
-            else:
-                # Auto-refresh if needed
-                await _prod_fetcher._maybe_refresh()
-            return _prod_fetcher
+            _prod_fetcher = fetcher
+        return fetcher
 
 
 async def close_config_fetchers():
     """Close all config fetcher instances.
     
-    Should be called during application shutdown.
+    Should be called during application shutdown. Safe to call repeatedly or
+    from several clients at once: the singletons are detached under the lock
+    before closing, so each fetcher is closed exactly once and further calls
+    are no-ops until a fetcher is created again.
     """
-    global _prod_fetcher, _dev_fetcher
+    global _prod_fetcher, _dev_fetcher, _shared_session, _shared_session_loop
     
-    if _prod_fetcher:
-        await _prod_fetcher.close()
+    async with _fetcher_lock:
+        fetchers = [f for f in (_prod_fetcher, _dev_fetcher) if f is not None]
+        session, session_loop = _shared_session, _shared_session_loop
         _prod_fetcher = None
-    
-    if _dev_fetcher:
-        await _dev_fetcher.close()
         _dev_fetcher = None
+        _shared_session = None
+        _shared_session_loop = None
+    
+    for fetcher in fetchers:
+        await fetcher.close()
+    
+    if session is not None and session_loop is asyncio.get_running_loop():
+        await session.close()
@@ -0,0 +1,28 @@
+"""JSON serialization helpers backed by orjson.
+
+orjson is several times faster than the standard library ``json`` module
+and works on bytes directly, which is what httpx hands us.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+loads = orjson.loads
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not support natively."""
+    if isinstance(obj, Decimal):
+        # Strings keep full precision; floats would not
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes, encoding Decimal values as strings."""
+    return orjson.dumps(obj, default=_default)
+
+
+__all__ = ["loads", "dumps"]
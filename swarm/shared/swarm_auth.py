@@ -1,19 +1,30 @@
 """Swarm authentication module - consolidates wallet-based authentication."""
 
 import asyncio
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List
-from dataclasses import dataclass
-
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, List, Set, Union
+from dataclasses import dataclass, field
+
+import httpx
 from eth_account.messages import encode_defunct
 from eth_account.signers.local import LocalAccount
 
 from .base_client import BaseAPIClient, APIException
+from .models import DATACLASS_SLOTS
 from .config import get_swarm_auth_url
 
 logger = logging.getLogger(__name__)
 
+# JSON:API resource types of the auth request payloads
+_NONCE_REQUEST_TYPE = "auth_nonce_request"
+_LOGIN_REQUEST_TYPE = "login_request"
+_REGISTER_REQUEST_TYPE = "register"
+
 
 # ============================================================================
 # Exceptions
@@ -33,13 +44,13 @@ class AuthenticationError(Exception):
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class NonceResponse:
     """Response from nonce request."""
     message: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LoginResponse:
     """Response from login request."""
     access_token: str
@@ -49,7 +60,7 @@ class LoginResponse:
     refresh_expires_in: int
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class UserAttributes:
     """User account attributes."""
     id: int
@@ -64,7 +75,7 @@ class UserAttributes:
     affiliate_campaign: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RegisterResponse:
     """Response from register request."""
     access_token: str
@@ -76,22 +87,51 @@ class RegisterResponse:
     user: UserAttributes
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AuthTokens:
-    """Authentication tokens with expiration."""
+    """Authentication tokens with expiration.
+    
+    ``expires_at``/``refresh_expires_at`` are timezone-aware UTC datetimes for
+    display and persistence (naive values, e.g. from older token files, are
+    taken as UTC); expiry checks use monotonic-clock deadlines derived from them
+    at construction, which are cheap to compare and immune to wall-clock jumps.
+    ``address`` is normalized to lowercase.
+    """
     access_token: str
     refresh_token: str
     expires_at: datetime
     refresh_expires_at: datetime
     address: str
+    expires_at_monotonic: float = field(init=False, repr=False, compare=False)
+    refresh_expires_at_monotonic: float = field(init=False, repr=False, compare=False)
     
-    def is_expired(self) -> bool:
-        """Check if access token is expired."""
-        return datetime.utcnow() >= self.expires_at
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        now_utc = datetime.now(timezone.utc)
+        now_monotonic = time.monotonic()
+        object.__setattr__(self, "address", self.address.lower())
+        for name in ("expires_at", "refresh_expires_at"):
+            value = getattr(self, name)
+            if value.tzinfo is None:
+                object.__setattr__(self, name, value.replace(tzinfo=timezone.utc))
+        object.__setattr__(
+            self,
+            "expires_at_monotonic",
+            now_monotonic + (self.expires_at - now_utc).total_seconds(),
+        )
+        object.__setattr__(
+            self,
+            "refresh_expires_at_monotonic",
+            now_monotonic + (self.refresh_expires_at - now_utc).total_seconds(),
+        )
+    
+    def is_expired(self, leeway: float = 0.0) -> bool:
+        """Check if access token is expired (or expires within ``leeway`` seconds)."""
+        return time.monotonic() + leeway >= self.expires_at_monotonic
     
     def is_refresh_expired(self) -> bool:
         """Check if refresh token is expired."""
-        return datetime.utcnow() >= self.refresh_expires_at
+        return time.monotonic() >= self.refresh_expires_at_monotonic
 
 
 # ============================================================================
@@ -99,7 +139,14 @@ class AuthTokens:
 # ============================================================================
 
 class TokenStorageInterface:
-    """Interface for token storage implementations."""
+    """Interface for token storage implementations.
+    
+    SwarmAuth always passes lowercase addresses, so implementations may use
+    them as keys as-is.
+    """
+
+    # Empty so slotted implementations don't get a __dict__ anyway
+    __slots__ = ()
     
     def save(self, address: str, tokens: AuthTokens):
         """Save tokens for an address."""
@@ -115,7 +162,13 @@ class TokenStorageInterface:
 
 
 class InMemoryStorage(TokenStorageInterface):
-    """Simple in-memory token storage (not persistent)."""
+    """Simple in-memory token storage (not persistent).
+    
+    Addresses are normalized to lowercase, as in FileTokenStorage, so callers
+    other than SwarmAuth may pass checksummed ones.
+    """
+
+    __slots__ = ("_store",)
 
     def __init__(self):
         self._store: Dict[str, AuthTokens] = {}
@@ -133,6 +186,70 @@ class InMemoryStorage(TokenStorageInterface):
         self._store.pop(address.lower(), None)
 
 
+class FileTokenStorage(TokenStorageInterface):
+    """Token storage persisted to a JSON file readable only by its owner.
+    
+    Lets short-lived processes reuse a still-valid session instead of signing
+    in again on every start. Default location: ``~/.cache/swarm/auth.json``.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = (
+            Path(path).expanduser() if path
+            else Path.home() / ".cache" / "swarm" / "auth.json"
+        )
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, str]]):
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def save(self, address: str, tokens: AuthTokens):
+        """Save tokens to the file."""
+        data = self._read()
+        data[address.lower()] = {
+            "access_token": tokens.access_token,
+            "refresh_token": tokens.refresh_token,
+            "expires_at": tokens.expires_at.isoformat(),
+            "refresh_expires_at": tokens.refresh_expires_at.isoformat(),
+            "address": tokens.address,
+        }
+        self._write(data)
+
+    def load(self, address: str) -> Optional[AuthTokens]:
+        """Load tokens from the file."""
+        entry = self._read().get(address.lower())
+        if not entry:
+            return None
+        try:
+            return AuthTokens(
+                access_token=entry["access_token"],
+                refresh_token=entry["refresh_token"],
+                expires_at=datetime.fromisoformat(entry["expires_at"]),
+                refresh_expires_at=datetime.fromisoformat(entry["refresh_expires_at"]),
+                address=entry["address"],
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed stored tokens in %s", self.path)
+            return None
+
+    def clear(self, address: str):
+        """Clear tokens from the file."""
+        data = self._read()
+        if data.pop(address.lower(), None) is not None:
+            self._write(data)
+
+
 # ============================================================================
 # Authentication Client
 # ============================================================================
@@ -152,20 +269,32 @@ class SwarmAuth(BaseAPIClient):
     Environment (dev/prod) is controlled via SWARM_COLLECTION_MODE env variable.
     """
 
-    def __init__(self, storage: Optional[TokenStorageInterface] = None):
+    def __init__(
+        self,
+        storage: Optional[TokenStorageInterface] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Initialize Swarm auth client.
 
         Args:
             storage: Token storage interface (default: InMemoryStorage)
+            transport: Optional shared HTTP connection pool (not closed by close())
         """
-        super().__init__(base_url=get_swarm_auth_url(), auth_token=None)
+        super().__init__(base_url=get_swarm_auth_url(), auth_token=None, transport=transport)
         self.storage = storage or InMemoryStorage()
+        # Lowercase addresses known to be registered. Only positive results are
+        # cached: a wallet never becomes unregistered, but may be registered
+        # elsewhere at any time.
+        self._registered_addresses: Set[str] = set()
 
     async def check_existence(self, address: str) -> bool:
         """
         Check if wallet address is registered.
 
+        Registered addresses are remembered for the lifetime of this client, so
+        repeated checks for them make no request.
+
         Args:
             address: Wallet address
 
@@ -173,11 +302,15 @@ class SwarmAuth(BaseAPIClient):
             True if address exists, False otherwise
         """
         address = address.lower()
+        if address in self._registered_addresses:
+            return True
+        
         endpoint = f"/addresses/{address}"
         
         try:
-            logger.debug(f"Checking existence: GET {self.base_url}{endpoint}")
+            logger.debug("Checking existence: GET %s%s", self.base_url, endpoint)
             await self._make_request("GET", endpoint)
+            self._registered_addresses.add(address)
             return True
         except APIException as e:
             # 404 means address doesn't exist
@@ -197,19 +330,12 @@ class SwarmAuth(BaseAPIClient):
             NonceResponse with message to sign
         """
         endpoint = "/nonce"
-        payload = {
-            "data": {
-                "type": "auth_nonce_request",
-                "attributes": {
-                    "address": address
-                }
-            }
-        }
-        
+        attributes = {"address": address}
         if terms:
-            payload["data"]["attributes"]["terms_hash"] = terms
+            attributes["terms_hash"] = terms
+        payload = {"data": {"type": _NONCE_REQUEST_TYPE, "attributes": attributes}}
 
-        logger.debug(f"Requesting nonce: POST {self.base_url}{endpoint}")
+        logger.debug("Requesting nonce: POST %s%s", self.base_url, endpoint)
         response = await self._make_request("POST", endpoint, data=payload)
         
         attrs = response.get("data", {}).get("attributes", {})
@@ -231,7 +357,7 @@ class SwarmAuth(BaseAPIClient):
         endpoint = "/login"
         payload = {
             "data": {
-                "type": "login_request",
+                "type": _LOGIN_REQUEST_TYPE,
                 "attributes": {
                     "auth_pair": {
                         "address": address,
@@ -241,7 +367,7 @@ class SwarmAuth(BaseAPIClient):
             }
         }
         
-        logger.debug(f"Logging in: POST {self.base_url}{endpoint}")
+        logger.debug("Logging in: POST %s%s", self.base_url, endpoint)
         response = await self._make_request("POST", endpoint, data=payload)
         
         attrs = response.get("data", {}).get("attributes", {})
@@ -272,24 +398,21 @@ class SwarmAuth(BaseAPIClient):
             RegisterResponse with tokens and user info
         """
         endpoint = "/register"
-        payload = {
-            "data": {
-                "type": "register",
-                "attributes": {
-                    "auth_pair": {
-                        "address": address,
-                        "signed_message": signed_message
-                    }
-                }
+        attributes = {
+            "auth_pair": {
+                "address": address,
+                "signed_message": signed_message
             }
         }
-        
         if safe_addresses:
-            payload["data"]["attributes"]["safe_addresses"] = safe_addresses
+            attributes["safe_addresses"] = safe_addresses
+        payload = {"data": {"type": _REGISTER_REQUEST_TYPE, "attributes": attributes}}
 
-        logger.debug(f"Registering: POST {self.base_url}{endpoint}")
+        logger.debug("Registering: POST %s%s", self.base_url, endpoint)
         response = await self._make_request("POST", endpoint, data=payload)
         
+        self._registered_addresses.add(address.lower())
+        
         attrs = response.get("data", {}).get("attributes", {})
         user_attrs = attrs.get("user", {}).get("attributes", {})
 
@@ -347,17 +470,26 @@ class SwarmAuth(BaseAPIClient):
             >>> print(f"Token expires at: {tokens.expires_at}")
         """
         address = signer.address
-        logger.info(f"Authenticating wallet: {address}")
-
-        # Step 1: Check if wallet is registered
-        exists = await self.check_existence(address)
-        logger.info(f"Wallet exists: {exists}")
+        logger.info("Authenticating wallet: %s", address)
+
+        # Steps 1-2: Check if wallet is registered and get nonce message.
+        # Most wallets are already registered, so request the login nonce
+        # concurrently with the existence check to save a round-trip.
+        exists, nonce = await asyncio.gather(
+            self.check_existence(address),
+            self.get_nonce(address),
+            return_exceptions=True,
+        )
+        if isinstance(exists, BaseException):
+            raise exists
+        logger.info("Wallet exists: %s", exists)
 
-        # Step 2: Get nonce message
-        if exists:
-            nonce = await self.get_nonce(address)
-        else:
+        if not exists:
+            # Registration needs a nonce issued with the terms hash; the
+            # speculative login nonce (or its error) is discarded
             nonce = await self.get_nonce(address, terms="Terms and Conditions")
+        elif isinstance(nonce, BaseException):
+            raise nonce
 
         # Step 3: Sign message
         try:
@@ -368,8 +500,9 @@ class SwarmAuth(BaseAPIClient):
         # Step 4: Login or register
         if exists:
             resp = await self.login(address, signature)
-            expires_at = datetime.utcnow() + timedelta(seconds=resp.expires_in)
-            refresh_expires_at = datetime.utcnow() + timedelta(seconds=resp.refresh_expires_in)
+            now = datetime.now(timezone.utc)
+            expires_at = now + timedelta(seconds=resp.expires_in)
+            refresh_expires_at = now + timedelta(seconds=resp.refresh_expires_in)
             
             tokens = AuthTokens(
                 access_token=resp.access_token,
@@ -380,8 +513,9 @@ class SwarmAuth(BaseAPIClient):
             )
         else:
             resp = await self.register(address, signature, safe_addresses)
-            expires_at = datetime.utcnow() + timedelta(seconds=resp.expires_in)
-            refresh_expires_at = datetime.utcnow() + timedelta(seconds=resp.refresh_expires_in)
+            now = datetime.now(timezone.utc)
+            expires_at = now + timedelta(seconds=resp.expires_in)
+            refresh_expires_at = now + timedelta(seconds=resp.refresh_expires_in)
             
             tokens = AuthTokens(
                 access_token=resp.access_token,
@@ -392,8 +526,8 @@ class SwarmAuth(BaseAPIClient):
             )
 
         # Step 5: Store tokens
-        self.storage.save(address, tokens)
-        logger.info(f"Authentication successful. Token expires at: {tokens.expires_at}")
+        self.storage.save(address.lower(), tokens)
+        logger.info("Authentication successful. Token expires at: %s", tokens.expires_at)
 
         return tokens
 
@@ -407,7 +541,7 @@ class SwarmAuth(BaseAPIClient):
         Returns:
             AuthTokens if found, None otherwise
         """
-        return self.storage.load(address)
+        return self.storage.load(address.lower())
 
     def clear_tokens(self, address: str):
         """
@@ -416,7 +550,7 @@ class SwarmAuth(BaseAPIClient):
         Args:
             address: Wallet address
         """
-        self.storage.clear(address)
+        self.storage.clear(address.lower())
 
     async def _sign_message_async(
         self,
@@ -427,6 +561,11 @@ class SwarmAuth(BaseAPIClient):
         """
         Sign message asynchronously with timeout.
 
+        A LocalAccount signs in-process with a short, CPU-only computation, so
+        it is signed inline: an executor round-trip would cost more. Other
+        signers (e.g. remote or hardware-backed) run in the default executor
+        under ``timeout``.
+
         Args:
             signer: LocalAccount to sign with
             message: Message to sign
@@ -435,15 +574,16 @@ class SwarmAuth(BaseAPIClient):
         Returns:
             Signed message (hex with 0x prefix)
         """
-        loop = asyncio.get_event_loop()
-        
         def sign_sync():
-            signature = signer.sign_message(encode_defunct(text=message)).signature.hex()
-            # Ensure signature starts with 0x (required by backend)
-            if not signature.startswith('0x'):
-                signature = '0x' + signature
-            return signature
+            signature = signer.sign_message(encode_defunct(text=message)).signature
+            # bytes.hex() never adds a prefix, whatever the HexBytes version;
+            # the backend requires 0x
+            return '0x' + bytes.hex(signature)
+        
+        if isinstance(signer, LocalAccount):
+            return sign_sync()
         
+        loop = asyncio.get_event_loop()
         return await asyncio.wait_for(
             loop.run_in_executor(None, sign_sync),
             timeout=timeout
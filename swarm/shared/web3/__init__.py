@@ -3,11 +3,17 @@
 from .helpers import Web3Helper
 from .constants import (
     ERC20_ABI,
+    MULTICALL3_ADDRESS,
+    MULTICALL3_ABI,
     RPC_ENDPOINTS,
     POA_NETWORKS,
     GAS_BUFFER_MULTIPLIER,
+    FEE_PARAMS_TTL,
+    CONNECTION_CHECK_TTL,
+    RPC_BATCH_SIZE,
     DEFAULT_GAS_LIMIT,
     TX_TIMEOUT,
+    RECEIPT_POLL_INTERVALS,
 )
 from .exceptions import (
     Web3Exception,
@@ -20,11 +26,17 @@ from .exceptions import (
 __all__ = [
     "Web3Helper",
     "ERC20_ABI",
+    "MULTICALL3_ADDRESS",
+    "MULTICALL3_ABI",
     "RPC_ENDPOINTS",
     "POA_NETWORKS",
     "GAS_BUFFER_MULTIPLIER",
+    "FEE_PARAMS_TTL",
+    "CONNECTION_CHECK_TTL",
+    "RPC_BATCH_SIZE",
     "DEFAULT_GAS_LIMIT",
     "TX_TIMEOUT",
+    "RECEIPT_POLL_INTERVALS",
     "Web3Exception",
     "InsufficientBalanceException",
     "TransactionFailedException",
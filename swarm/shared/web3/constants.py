@@ -64,6 +64,39 @@ ERC20_ABI = [
     },
 ]
 
+# Multicall3 is deployed at the same address on every supported network
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI (aggregate3 only)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
 # RPC endpoints for different networks (public RPCs)
 RPC_ENDPOINTS = {
     Network.ETHEREUM: "https://eth.llamarpc.com",
@@ -77,8 +110,20 @@ POA_NETWORKS = [Network.POLYGON]
 # Gas buffer multiplier (adds 20% to gas estimates for safety)
 GAS_BUFFER_MULTIPLIER = 1.2
 
+# How long EIP-1559 fee parameters from eth_feeHistory are reused, in seconds
+FEE_PARAMS_TTL = 3.0
+
+# How long an RPC connectivity check result is reused, in seconds
+CONNECTION_CHECK_TTL = 2.0
+
+# Maximum number of requests per JSON-RPC batch
+RPC_BATCH_SIZE = 100
+
 # Default gas limit for ERC20 transfers (fallback if estimation fails)
 DEFAULT_GAS_LIMIT = 100000
 
 # Transaction timeout in seconds
 TX_TIMEOUT = 300
+
+# Receipt poll intervals in seconds; the last one repeats until TX_TIMEOUT
+RECEIPT_POLL_INTERVALS = (0.2, 0.5, 1.0, 2.0)
@@ -1,22 +1,42 @@
 """Web3 helper for blockchain transactions."""
 
+import asyncio
+import functools
 import logging
+import sqlite3
+import statistics
+import threading
+import time
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+import aiohttp
 from web3 import AsyncWeb3
+from web3._utils.caching import generate_cache_key
+from web3.contract import AsyncContract
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
+from eth_abi import encode as abi_encode
+from eth_utils import keccak, to_checksum_address
 
-from ..models import Network
+from ..models import GasEstimate, Network, TokenTransfer
+from ..constants import TOKEN_DECIMALS_BY_ADDRESS
 from .constants import (
     ERC20_ABI,
+    MULTICALL3_ADDRESS,
+    MULTICALL3_ABI,
     RPC_ENDPOINTS,
     POA_NETWORKS,
     GAS_BUFFER_MULTIPLIER,
+    FEE_PARAMS_TTL,
+    CONNECTION_CHECK_TTL,
+    RPC_BATCH_SIZE,
     DEFAULT_GAS_LIMIT,
     TX_TIMEOUT,
+    RECEIPT_POLL_INTERVALS,
 )
 from .exceptions import (
     InsufficientBalanceException,
@@ -26,6 +46,223 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# EIP-55 checksumming hashes the address; the same few addresses recur on
+# every call, so memoize it
+_to_checksum_address = functools.lru_cache(maxsize=4096)(to_checksum_address)
+
+# Fixed ERC20 view-call selectors, so hot reads skip web3's ABI lookup
+_BALANCE_OF_SELECTOR = keccak(text="balanceOf(address)")[:4]
+_ALLOWANCE_SELECTOR = keccak(text="allowance(address,address)")[:4]
+_DECIMALS_CALLDATA = keccak(text="decimals()")[:4]
+
+
+def _encode_balance_of(owner: str) -> bytes:
+    """Encode balanceOf(owner) calldata."""
+    return _BALANCE_OF_SELECTOR + abi_encode(["address"], [owner])
+
+
+def _encode_allowance(owner: str, spender: str) -> bytes:
+    """Encode allowance(owner, spender) calldata."""
+    return _ALLOWANCE_SELECTOR + abi_encode(["address", "address"], [owner, spender])
+
+
+# Decimals of every supported network's native token (ETH, POL, BNB)
+_NATIVE_DECIMALS = 18
+
+
+def _to_smallest_units(amount: Decimal, decimals: int) -> int:
+    """Convert a normalized amount to integer smallest units, truncating.
+
+    Works on the Decimal's digits and exponent with integer arithmetic, so
+    the result is exact for any amount (Decimal multiplication would round
+    to the context's 28 significant digits).
+    """
+    sign, digits, exponent = amount.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"Cannot convert {amount} to smallest units")
+    value = int("".join(map(str, digits)))
+    shift = exponent + decimals
+    value = value * 10 ** shift if shift >= 0 else value // 10 ** -shift
+    return -value if sign else value
+
+
+def _from_smallest_units(value: int, decimals: int) -> Decimal:
+    """Convert integer smallest units to an exact normalized Decimal.
+
+    Trailing fractional zeros are dropped (but not integer ones), giving the
+    same form as ``Decimal(value) / 10 ** decimals``: 0, 1.5, 10.
+    """
+    sign = 1 if value < 0 else 0
+    value = abs(value)
+    exponent = -decimals
+    while exponent < 0 and value and value % 10 == 0:
+        value //= 10
+        exponent += 1
+    if not value:
+        return Decimal(0)
+    return Decimal((sign, tuple(map(int, str(value))), exponent))
+
+
+class _DecimalsStore:
+    """On-disk cache of ERC20 decimals, which never change for a contract.
+
+    Keyed by ``"{chain_id}:{lowercase address}"``. Storage errors are logged
+    and treated as cache misses, so a read-only or missing cache directory
+    only costs the RPC call.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS erc20_decimals "
+                "(key TEXT PRIMARY KEY, decimals INTEGER NOT NULL)"
+            )
+            self._db = db
+        return self._db
+
+    def get(self, key: str) -> Optional[int]:
+        try:
+            row = self._connect().execute(
+                "SELECT decimals FROM erc20_decimals WHERE key = ?", (key,)
+            ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Decimals cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, decimals: int):
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO erc20_decimals (key, decimals) VALUES (?, ?)",
+                (key, decimals),
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Decimals cache write failed: {e}")
+
+
+_decimals_store = _DecimalsStore(Path.home() / ".cache" / "swarm" / "erc20_decimals.sqlite")
+
+
+# HTTP sessions shared by the RPC providers of all Web3Helper instances. An
+# aiohttp session only works on the loop that created it, so there is one per
+# event loop, with the number of providers attached to it.
+_rpc_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+_rpc_session_users: Dict[asyncio.AbstractEventLoop, int] = {}
+
+_RPC_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+
+def _acquire_rpc_session(loop: asyncio.AbstractEventLoop) -> aiohttp.ClientSession:
+    """Get (creating if needed) ``loop``'s shared RPC session and count one more user."""
+    # Forget sessions of loops that were shut down without releasing them
+    for stale_loop in [l for l in _rpc_sessions if l.is_closed()]:
+        del _rpc_sessions[stale_loop]
+        _rpc_session_users.pop(stale_loop, None)
+    
+    session = _rpc_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            ),
+            # As in web3's own sessions, HTTP error statuses from the node raise
+            raise_for_status=True,
+        )
+        _rpc_sessions[loop] = session
+    _rpc_session_users[loop] = _rpc_session_users.get(loop, 0) + 1
+    return session
+
+
+def _release_rpc_session(loop: asyncio.AbstractEventLoop) -> Optional[aiohttp.ClientSession]:
+    """Drop one user of ``loop``'s shared session.
+
+    Returns:
+        The session if this was its last user and it still needs closing
+    """
+    users = _rpc_session_users.get(loop, 0) - 1
+    if users > 0:
+        _rpc_session_users[loop] = users
+        return None
+    _rpc_session_users.pop(loop, None)
+    session = _rpc_sessions.pop(loop, None)
+    if session is None or session.closed:
+        return None
+    return session
+
+
+async def _close_released_session(
+    session: Optional[aiohttp.ClientSession],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a session returned by _release_rpc_session, if it can be closed from here."""
+    # A session bound to another loop can't be closed from this one; drop it
+    if session is not None and loop is asyncio.get_running_loop():
+        await session.close()
+
+
+class _PooledHTTPProvider(AsyncWeb3.AsyncHTTPProvider):
+    """AsyncHTTPProvider that sends requests over the shared RPC session.
+
+    The session is attached on the first request on each event loop, and
+    counts as in use from then until release_session().
+    """
+
+    def __init__(self, endpoint_uri: str):
+        super().__init__(endpoint_uri, request_kwargs={"timeout": _RPC_TIMEOUT})
+        self._pooled_session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _attach_session(self):
+        loop = asyncio.get_running_loop()
+        if (
+            loop is self._session_loop
+            and self._pooled_session is not None
+            and not self._pooled_session.closed
+        ):
+            return
+        
+        # Swap sessions without awaiting, so concurrent first requests on this
+        # provider can't both acquire one
+        old_loop = self._session_loop
+        released = _release_rpc_session(old_loop) if old_loop is not None else None
+        session = _acquire_rpc_session(loop)
+        self._pooled_session = session
+        self._session_loop = loop
+        
+        # web3 ignores a session passed for an endpoint it already has cached
+        # (and replaces stale ones with its own), so overwrite the entry directly.
+        # The cache key format and session_cache are web3 7 internals; the
+        # dependency is pinned to that major version in pyproject.toml.
+        cache_key = generate_cache_key(f"{threading.get_ident()}:{self.endpoint_uri}")
+        session_cache = self._request_session_manager.session_cache
+        session_cache.pop(cache_key)
+        session_cache.cache(cache_key, session)
+        
+        if old_loop is not None:
+            await _close_released_session(released, old_loop)
+
+    async def release_session(self):
+        """Stop using the shared session, closing it if this was the last user."""
+        loop, self._session_loop, self._pooled_session = self._session_loop, None, None
+        if loop is not None:
+            await _close_released_session(_release_rpc_session(loop), loop)
+
+    async def make_request(self, method, params):
+        await self._attach_session()
+        return await super().make_request(method, params)
+
+    async def make_batch_request(self, batch_requests):
+        await self._attach_session()
+        return await super().make_batch_request(batch_requests)
+
 
 class Web3Helper:
     """
@@ -38,6 +275,13 @@ class Web3Helper:
     - Native token balance checks
     """
 
+    # Decimals by (chain_id, lowercase token address), shared by all instances
+    # and seeded with well-known tokens. Backed by an on-disk cache.
+    _decimals_cache: Dict[Tuple[int, str], int] = {
+        (int(network), address): decimals
+        for (network, address), decimals in TOKEN_DECIMALS_BY_ADDRESS.items()
+    }
+
     def __init__(self, private_key: str, network: Network, rpc_url: Optional[str] = None):
         """
         Initialize Web3 helper.
@@ -53,26 +297,76 @@ class Web3Helper:
         self.network = network
         self.chain_id = network.value
         
-        # Initialize Web3 with RPC
+        # Resolve RPC endpoint
         if rpc_url is None:
             rpc_url = RPC_ENDPOINTS.get(network)
             if not rpc_url:
                 raise NetworkNotSupportedException(network.name)
         
-        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        # The AsyncWeb3 instance and contract factories are built on first use
+        # (see w3); RPC connections are pooled across helpers (see close())
+        self.rpc_url = rpc_url
+        self._contracts: Dict[str, AsyncContract] = {}
         
-        # Add PoA middleware for certain chains
-        if network in POA_NETWORKS:
-            self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        # Transaction fee fields and the monotonic time they expire
+        self._fee_params_cache: Optional[Dict[str, int]] = None
+        self._fee_params_expiry = 0.0
+        
+        # Last nonce handed out, so back-to-back sends don't reuse a nonce the
+        # node has not yet counted as pending
+        self._last_nonce: Optional[int] = None
+        
+        # Last connectivity check result and the monotonic time it expires
+        self._connected = False
+        self._connected_expiry = 0.0
         
         # Initialize account
         self.account: LocalAccount = Account.from_key(private_key)
         self.address = self.account.address
         
-        logger.info(f"Initialized AsyncWeb3 for {network.name} (chain_id: {self.chain_id})")
+        logger.info(f"Initialized Web3 helper for {network.name} (chain_id: {self.chain_id})")
         logger.info(f"Wallet address: {self.address}")
         logger.info(f"RPC: {rpc_url}")
 
+    @functools.cached_property
+    def w3(self) -> AsyncWeb3:
+        """AsyncWeb3 instance, created on first access."""
+        w3 = AsyncWeb3(_PooledHTTPProvider(self.rpc_url))
+        
+        # Add PoA middleware for certain chains
+        if self.network in POA_NETWORKS:
+            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        return w3
+
+    @functools.cached_property
+    def _erc20(self) -> Type[AsyncContract]:
+        """ERC20 contract factory, built once so per-token contracts don't
+        re-process the ABI."""
+        return self.w3.eth.contract(abi=ERC20_ABI)
+
+    @functools.cached_property
+    def _multicall(self) -> AsyncContract:
+        """Multicall3 contract."""
+        return self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self):
+        """Release the shared RPC connection pool.
+
+        The pool is closed once every helper that has sent a request on it has
+        been closed. Safe to call more than once.
+        """
+        # Only a helper whose provider has been used holds a reference
+        if "w3" in self.__dict__:
+            await self.w3.provider.release_session()
+
     async def get_balance(self, token_address: str) -> Decimal:
         """
         Get ERC20 token balance.
@@ -83,20 +377,71 @@ class Web3Helper:
         Returns:
             Token balance in normalized decimal units
         """
-        token_address = self.w3.to_checksum_address(token_address)
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
+        token_address = _to_checksum_address(token_address)
         
-        # Get balance in smallest units
-        balance_wei = await contract.functions.balanceOf(self.address).call()
-        
-        # Get decimals
-        decimals = await self._get_token_decimals(token_address)
+        # Get balance in smallest units and decimals in one round-trip
+        balance_wei, decimals = await self._call_with_decimals(
+            token_address, _encode_balance_of(self.address)
+        )
         
         # Convert to normalized decimal
-        balance = Decimal(balance_wei) / Decimal(10 ** decimals)
+        balance = _from_smallest_units(balance_wei, decimals)
         
         return balance
 
+    async def get_balances(self, token_addresses: Sequence[str]) -> Dict[str, Decimal]:
+        """
+        Get ERC20 token balances for several tokens in one call.
+
+        All balances, and the decimals of tokens not already cached, are read
+        in a single Multicall3 aggregate3 call. If that fails (e.g. Multicall3
+        is rate-limited by the provider), the same reads are sent as JSON-RPC
+        batches of eth_calls instead.
+
+        Args:
+            token_addresses: Token contract addresses
+
+        Returns:
+            Token balances in normalized decimal units, keyed by checksummed
+            token address
+        """
+        tokens = list(dict.fromkeys(_to_checksum_address(t) for t in token_addresses))
+        if not tokens:
+            return {}
+        
+        # balanceOf(self.address) calldata is the same for every token
+        balance_data = _encode_balance_of(self.address)
+        decimals = {token: self._cached_decimals(token) for token in tokens}
+        uncached = [token for token in tokens if decimals[token] is None]
+        
+        calls = (
+            [(token, balance_data) for token in tokens]
+            + [(token, _DECIMALS_CALLDATA) for token in uncached]
+        )
+        try:
+            results = await self._multicall3(calls)
+        except Exception as e:
+            logger.warning(f"Multicall3 aggregate3 failed: {e}, using JSON-RPC batch")
+            results = await self._eth_call_batch(calls)
+        
+        for token, result in zip(uncached, results[len(tokens):]):
+            if result is None:
+                logger.warning(f"Failed to get decimals for {token}, using default 18")
+                decimals[token] = 18
+            else:
+                (decimals[token],) = self.w3.codec.decode(["uint8"], result)
+                self._remember_decimals(token, decimals[token])
+        
+        balances = {}
+        for token, result in zip(tokens, results):
+            if result is None:
+                # Retry on its own so a failing token raises its own error
+                balances[token] = await self.get_balance(token)
+                continue
+            (balance_wei,) = self.w3.codec.decode(["uint256"], result)
+            balances[token] = _from_smallest_units(balance_wei, decimals[token])
+        return balances
+
     async def get_allowance(self, token_address: str, spender: str) -> Decimal:
         """
         Get token allowance for a spender.
@@ -108,18 +453,16 @@ class Web3Helper:
         Returns:
             Allowance in normalized decimal units
         """
-        token_address = self.w3.to_checksum_address(token_address)
-        spender = self.w3.to_checksum_address(spender)
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
-        
-        # Get allowance in smallest units
-        allowance_wei = await contract.functions.allowance(self.address, spender).call()
+        token_address = _to_checksum_address(token_address)
+        spender = _to_checksum_address(spender)
         
-        # Get decimals
-        decimals = await self._get_token_decimals(token_address)
+        # Get allowance in smallest units and decimals in one round-trip
+        allowance_wei, decimals = await self._call_with_decimals(
+            token_address, _encode_allowance(self.address, spender)
+        )
         
         # Convert to normalized decimal
-        allowance = Decimal(allowance_wei) / Decimal(10 ** decimals)
+        allowance = _from_smallest_units(allowance_wei, decimals)
         
         return allowance
 
@@ -145,32 +488,35 @@ class Web3Helper:
         Raises:
             TransactionFailedException: When transaction fails
         """
-        token_address = self.w3.to_checksum_address(token_address)
-        spender = self.w3.to_checksum_address(spender)
+        token_address = _to_checksum_address(token_address)
+        spender = _to_checksum_address(spender)
         
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
-        decimals = await self._get_token_decimals(token_address)
+        contract = self._contract(token_address)
+        decimals = await self.get_token_decimals(token_address)
         
         # Convert to smallest units
-        amount_wei = int(amount * Decimal(10 ** decimals))
+        amount_wei = _to_smallest_units(amount, decimals)
         
         logger.info(f"Approving {amount} tokens for {spender}")
         
         # Build transaction
-        nonce = await self.w3.eth.get_transaction_count(self.address)
-        gas_price = await self.w3.eth.gas_price
+        pending_nonce, fee_params = await asyncio.gather(
+            self.w3.eth.get_transaction_count(self.address, "pending"),
+            self._fee_params(),
+        )
         
         transaction = await contract.functions.approve(
             spender, amount_wei
         ).build_transaction({
             "from": self.address,
             "gas": 100000,  # Standard approve gas
-            "gasPrice": gas_price,
-            "nonce": nonce,
+            "nonce": pending_nonce,
             "chainId": self.chain_id,
+            **fee_params,
         })
         
         # Sign and send
+        transaction["nonce"] = self._reserve_nonce(pending_nonce)
         return await self._sign_and_send_transaction(transaction, wait_for_receipt)
 
     async def transfer_token(
@@ -196,11 +542,44 @@ class Web3Helper:
             InsufficientBalanceException: When balance is insufficient
             TransactionFailedException: When transaction fails
         """
-        token_address = self.w3.to_checksum_address(token_address)
-        to_address = self.w3.to_checksum_address(to_address)
+        token_address = _to_checksum_address(token_address)
+        to_address = _to_checksum_address(to_address)
+        
+        # The balance read also returns decimals. When decimals are already
+        # cached the gas estimate does not need to wait for it, and both run
+        # concurrently in a single round-trip.
+        balance_task = asyncio.create_task(
+            self._call_with_decimals(token_address, _encode_balance_of(self.address))
+        )
+        try:
+            decimals = self._cached_decimals(token_address)
+            if decimals is None:
+                _, decimals = await balance_task
+            
+            contract = self._contract(token_address)
+            
+            # Convert to smallest units
+            amount_wei = _to_smallest_units(amount, decimals)
+            transfer = contract.functions.transfer(to_address, amount_wei)
+        except BaseException:
+            # Don't leave the balance read running unobserved
+            balance_task.cancel()
+            raise
+        
+        # Estimate gas and fetch the nonce in one batch, alongside the balance
+        # check and fee lookup
+        (balance_wei, _), (gas_estimate, pending_nonce), fee_params = await asyncio.gather(
+            balance_task,
+            self._rpc_batch(
+                lambda: transfer.estimate_gas({"from": self.address}),
+                lambda: self.w3.eth.get_transaction_count(self.address, "pending"),
+                tolerate=(0,),
+            ),
+            self._fee_params(),
+        )
         
         # Check balance
-        balance = await self.get_balance(token_address)
+        balance = _from_smallest_units(balance_wei, decimals)
         if balance < amount:
             raise InsufficientBalanceException(
                 required=float(amount),
@@ -208,40 +587,130 @@ class Web3Helper:
                 token=token_address,
             )
         
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
-        decimals = await self._get_token_decimals(token_address)
-        
-        # Convert to smallest units
-        amount_wei = int(amount * Decimal(10 ** decimals))
-        
         logger.info(f"Transferring {amount} tokens to {to_address}")
         logger.info(f"Amount in smallest units: {amount_wei}")
         
-        # Estimate gas
-        gas_info = await self.estimate_gas(to_address, token_address, amount)
-        
         # Build transaction
-        nonce = await self.w3.eth.get_transaction_count(self.address)
-        
-        transaction = await contract.functions.transfer(
-            to_address, amount_wei
-        ).build_transaction({
+        transaction = await transfer.build_transaction({
             "from": self.address,
-            "gas": gas_info["gas_limit"],
-            "gasPrice": gas_info["gas_price"],
-            "nonce": nonce,
+            "gas": self._buffered_gas_limit(gas_estimate),
+            "nonce": pending_nonce,
             "chainId": self.chain_id,
+            **fee_params,
         })
         
         # Sign and send
+        transaction["nonce"] = self._reserve_nonce(pending_nonce)
         return await self._sign_and_send_transaction(transaction, wait_for_receipt)
 
+    async def batch_transfer(
+        self,
+        transfers: Sequence[TokenTransfer],
+        wait_for_receipt: bool = True,
+    ) -> List[Union[str, TransactionFailedException]]:
+        """
+        Send several ERC20 transfers at once.
+
+        Balances for all tokens are checked up front, so nothing is sent if
+        any token is short. Gas estimates and the nonce are fetched in one
+        batch, consecutive nonces are assigned locally, and the signed
+        transactions are sent concurrently.
+
+        A failed send or receipt does not abort the batch: every transfer gets
+        its own result, so the caller can tell which transactions went out and
+        must not be sent again.
+
+        Args:
+            transfers: Transfers to send
+            wait_for_receipt: Wait for every transaction's confirmation
+
+        Returns:
+            For each transfer, in the order of ``transfers``, its transaction
+            hash or the TransactionFailedException it failed with. The
+            exception's ``tx_hash`` is set if the transaction was broadcast.
+
+        Raises:
+            InsufficientBalanceException: When a token balance is insufficient
+        """
+        if not transfers:
+            return []
+        
+        items = [
+            (
+                _to_checksum_address(t.to_address),
+                _to_checksum_address(t.token_address),
+                t.amount,
+            )
+            for t in transfers
+        ]
+        
+        # Balances (and decimals) for every token in one call
+        balances = await self.get_balances([token for _, token, _ in items])
+        required: Dict[str, Decimal] = {}
+        for _, token, amount in items:
+            required[token] = required.get(token, Decimal(0)) + amount
+        for token, amount in required.items():
+            if balances[token] < amount:
+                raise InsufficientBalanceException(
+                    required=float(amount),
+                    available=float(balances[token]),
+                    token=token,
+                )
+        
+        # Decimals are cached by the balance read
+        decimals = {token: await self.get_token_decimals(token) for token in required}
+        calls = [
+            self._contract(token).functions.transfer(
+                to_address, _to_smallest_units(amount, decimals[token])
+            )
+            for to_address, token, amount in items
+        ]
+        
+        logger.info(f"Sending {len(calls)} token transfers")
+        
+        # Estimate gas for every transfer and fetch the nonce in one batch
+        estimates_and_nonce, fee_params = await asyncio.gather(
+            self._rpc_batch(
+                *(
+                    functools.partial(call.estimate_gas, {"from": self.address})
+                    for call in calls
+                ),
+                lambda: self.w3.eth.get_transaction_count(self.address, "pending"),
+                tolerate=range(len(calls)),
+            ),
+            self._fee_params(),
+        )
+        *gas_estimates, pending_nonce = estimates_and_nonce
+        
+        transactions = await asyncio.gather(*(
+            call.build_transaction({
+                "from": self.address,
+                "gas": self._buffered_gas_limit(gas_estimate),
+                "nonce": pending_nonce,
+                "chainId": self.chain_id,
+                **fee_params,
+            })
+            for call, gas_estimate in zip(calls, gas_estimates)
+        ))
+        
+        # Consecutive nonces, assigned in order
+        for transaction in transactions:
+            transaction["nonce"] = self._reserve_nonce(pending_nonce)
+        
+        return list(await asyncio.gather(
+            *(
+                self._sign_and_send_transaction(transaction, wait_for_receipt)
+                for transaction in transactions
+            ),
+            return_exceptions=True,
+        ))
+
     async def estimate_gas(
         self,
         to_address: str,
         token_address: str,
         amount: Decimal,
-    ) -> Dict[str, Any]:
+    ) -> GasEstimate:
         """
         Estimate gas for token transfer.
 
@@ -251,38 +720,107 @@ class Web3Helper:
             amount: Amount to transfer (normalized)
 
         Returns:
-            Dict with gas_limit, gas_price, and gas_cost
+            GasEstimate with gas_limit, gas_price, and gas_cost. On EIP-1559
+            networks gas_price is the max fee per gas, so gas_cost is an upper
+            bound.
         """
-        token_address = self.w3.to_checksum_address(token_address)
-        to_address = self.w3.to_checksum_address(to_address)
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
+        token_address = _to_checksum_address(token_address)
+        to_address = _to_checksum_address(to_address)
+        contract = self._contract(token_address)
         
-        decimals = await self._get_token_decimals(token_address)
-        amount_wei = int(amount * Decimal(10 ** decimals))
+        decimals = await self.get_token_decimals(token_address)
+        amount_wei = _to_smallest_units(amount, decimals)
         
-        # Estimate gas
-        try:
-            gas_limit = await contract.functions.transfer(
-                to_address, amount_wei
-            ).estimate_gas({"from": self.address})
-            
-            # Add buffer
-            gas_limit = int(gas_limit * GAS_BUFFER_MULTIPLIER)
-        except Exception as e:
-            logger.warning(f"Gas estimation failed: {e}, using default")
-            gas_limit = DEFAULT_GAS_LIMIT
+        transfer = contract.functions.transfer(to_address, amount_wei)
         
-        # Get gas price
-        gas_price = await self.w3.eth.gas_price
+        # Estimate gas and get fee parameters concurrently
+        gas_estimate, fee_params = await asyncio.gather(
+            transfer.estimate_gas({"from": self.address}),
+            self._fee_params(),
+            return_exceptions=True,
+        )
+        if isinstance(fee_params, Exception):
+            raise fee_params
+        gas_limit = self._buffered_gas_limit(gas_estimate)
+        gas_price = fee_params.get("maxFeePerGas", fee_params.get("gasPrice"))
         
         # Calculate cost in native token
-        gas_cost = Decimal(gas_limit * gas_price) / Decimal(10 ** 18)
+        gas_cost = _from_smallest_units(gas_limit * gas_price, _NATIVE_DECIMALS)
         
-        return {
-            "gas_limit": gas_limit,
-            "gas_price": gas_price,
-            "gas_cost": gas_cost,
-        }
+        return GasEstimate(
+            gas_limit=gas_limit,
+            gas_price=gas_price,
+            gas_cost=gas_cost,
+        )
+
+    async def _fee_params(self) -> Dict[str, int]:
+        """
+        Get transaction fee fields, reused for FEE_PARAMS_TTL seconds.
+
+        Uses EIP-1559 fees from one eth_feeHistory call over the last 5 blocks:
+        the median 50th-percentile priority fee, and a max fee of twice the
+        latest base fee plus that tip. Networks without EIP-1559 get a legacy
+        gas price.
+
+        Returns:
+            Either maxFeePerGas and maxPriorityFeePerGas, or gasPrice
+        """
+        now = time.monotonic()
+        if self._fee_params_cache is not None and now < self._fee_params_expiry:
+            return self._fee_params_cache
+        
+        try:
+            history = await self.w3.eth.fee_history(5, "latest", [50])
+            base_fee = history["baseFeePerGas"][-1]
+            priority_fee = int(statistics.median(
+                rewards[0] for rewards in history["reward"]
+            ))
+            fee_params = {
+                "maxFeePerGas": base_fee * 2 + priority_fee,
+                "maxPriorityFeePerGas": priority_fee,
+            }
+        except Exception as e:
+            logger.debug(f"Fee history unavailable: {e}, using legacy gas price")
+            fee_params = {"gasPrice": await self.w3.eth.gas_price}
+        
+        self._fee_params_cache = fee_params
+        self._fee_params_expiry = now + FEE_PARAMS_TTL
+        return fee_params
+
+    def _reserve_nonce(self, pending_nonce: int) -> int:
+        """
+        Hand out the next nonce for a transaction.
+
+        Uses the node's pending transaction count, but never a nonce at or
+        below one already handed out, so concurrent or back-to-back sends get
+        distinct nonces. Synchronous, so it cannot interleave with another
+        reservation.
+
+        Args:
+            pending_nonce: Transaction count including pending transactions
+
+        Returns:
+            Nonce to use
+        """
+        if self._last_nonce is not None and pending_nonce <= self._last_nonce:
+            pending_nonce = self._last_nonce + 1
+        self._last_nonce = pending_nonce
+        return pending_nonce
+
+    def _buffered_gas_limit(self, gas_estimate: Any) -> int:
+        """
+        Add the safety buffer to a gas estimate.
+
+        Args:
+            gas_estimate: Estimated gas, or the exception the estimate raised
+
+        Returns:
+            Buffered gas limit, or DEFAULT_GAS_LIMIT if estimation failed
+        """
+        if isinstance(gas_estimate, Exception):
+            logger.warning(f"Gas estimation failed: {gas_estimate}, using default")
+            return DEFAULT_GAS_LIMIT
+        return int(gas_estimate * GAS_BUFFER_MULTIPLIER)
 
     async def get_native_balance(self) -> Decimal:
         """
@@ -292,29 +830,264 @@ class Web3Helper:
             Native token balance
         """
         balance_wei = await self.w3.eth.get_balance(self.address)
-        balance = Decimal(balance_wei) / Decimal(10 ** 18)
+        balance = _from_smallest_units(balance_wei, _NATIVE_DECIMALS)
         return balance
 
     async def is_connected(self) -> bool:
-        """Check if Web3 is connected to RPC."""
-        return await self.w3.is_connected()
+        """Check if Web3 is connected to RPC.
+
+        The result is reused for CONNECTION_CHECK_TTL seconds, so polling
+        callers don't issue an RPC call on every check.
+        """
+        now = time.monotonic()
+        if now >= self._connected_expiry:
+            self._connected = await self.w3.is_connected()
+            self._connected_expiry = now + CONNECTION_CHECK_TTL
+        return self._connected
+
+    async def wait_for_receipt(self, tx_hash: Any, timeout: float = TX_TIMEOUT) -> Dict[str, Any]:
+        """
+        Wait for a transaction receipt.
+
+        Polls with increasing intervals (RECEIPT_POLL_INTERVALS) instead of
+        web3's fixed 0.1 s, since confirmation takes at least one block and
+        early polls almost always come back empty.
+
+        Args:
+            tx_hash: Transaction hash
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Transaction receipt
+
+        Raises:
+            TimeExhausted: When no receipt arrives within timeout
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            try:
+                return await self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            
+            interval = RECEIPT_POLL_INTERVALS[min(attempt, len(RECEIPT_POLL_INTERVALS) - 1)]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeExhausted(
+                    f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds"
+                )
+            await asyncio.sleep(min(interval, remaining))
+            attempt += 1
+
+    async def get_token_decimals(self, token_address: str) -> int:
+        """
+        Get token decimals, from the in-memory or on-disk cache when possible.
+
+        Args:
+            token_address: Token contract address
+
+        Returns:
+            Number of decimals
+        """
+        decimals = self._cached_decimals(token_address)
+        if decimals is not None:
+            return decimals
+        return await self._get_token_decimals(_to_checksum_address(token_address))
+
+    def _cached_decimals(self, token_address: str) -> Optional[int]:
+        """
+        Look up token decimals in memory, then on disk.
+
+        Args:
+            token_address: Token contract address
+
+        Returns:
+            Number of decimals, or None if not cached
+        """
+        key = (self.chain_id, token_address.lower())
+        decimals = self._decimals_cache.get(key)
+        if decimals is None:
+            decimals = _decimals_store.get(f"{key[0]}:{key[1]}")
+            if decimals is not None:
+                self._decimals_cache[key] = decimals
+        return decimals
+
+    def _remember_decimals(self, token_address: str, decimals: int):
+        """Cache token decimals in memory and on disk."""
+        key = (self.chain_id, token_address.lower())
+        self._decimals_cache[key] = decimals
+        _decimals_store.set(f"{key[0]}:{key[1]}", decimals)
+
+    async def _call_with_decimals(
+        self,
+        token_address: str,
+        call_data: bytes,
+    ) -> Tuple[int, int]:
+        """
+        Call a uint256 ERC20 view function and fetch the token's decimals.
+
+        Both reads go through a single Multicall3 aggregate3 call. Well-known
+        tokens skip the decimals read, and if aggregate3 fails the reads are
+        made separately.
+
+        Args:
+            token_address: Checksummed token contract address
+            call_data: Encoded call to a view function returning uint256
+
+        Returns:
+            Tuple of (function result, decimals)
+        """
+        decimals = self._cached_decimals(token_address)
+        if decimals is None:
+            try:
+                value_data, decimals_data = await self._multicall3([
+                    (token_address, call_data),
+                    (token_address, _DECIMALS_CALLDATA),
+                ])
+            except Exception as e:
+                logger.warning(f"Multicall3 aggregate3 failed: {e}, using separate calls")
+                value_data = None
+            
+            if value_data is not None:
+                (value,) = self.w3.codec.decode(["uint256"], value_data)
+                if decimals_data is None:
+                    logger.warning(
+                        f"Failed to get decimals for {token_address}, using default 18"
+                    )
+                    return value, 18
+                (decimals,) = self.w3.codec.decode(["uint8"], decimals_data)
+                self._remember_decimals(token_address, decimals)
+                return value, decimals
+            
+            decimals = await self._get_token_decimals(token_address)
+        
+        value_data = await self.w3.eth.call({"to": token_address, "data": call_data})
+        (value,) = self.w3.codec.decode(["uint256"], value_data)
+        return value, decimals
+
+    async def _rpc_batch(
+        self,
+        *calls: Callable[[], Awaitable[Any]],
+        tolerate: Sequence[int] = (),
+    ) -> List[Any]:
+        """
+        Send independent RPC requests as a single JSON-RPC batch.
+
+        Each call is a zero-argument callable issuing one request (e.g.
+        ``lambda: self.w3.eth.get_block_number()``), so it can be made inside
+        the batch context or on its own. If the batch fails (provider without
+        batch support, or one request erroring) the requests are re-sent
+        individually and concurrently.
+
+        Args:
+            *calls: Request factories
+            tolerate: Indices of calls whose failure is returned in place as
+                the exception instead of raised
+
+        Returns:
+            Results in call order
+        """
+        try:
+            async with self.w3.batch_requests() as batch:
+                for call in calls:
+                    batch.add(call())
+                return list(await batch.async_execute())
+        except Exception as e:
+            logger.debug(f"JSON-RPC batch failed: {e}, sending requests individually")
+        
+        results = await asyncio.gather(*(call() for call in calls), return_exceptions=True)
+        for i, result in enumerate(results):
+            if isinstance(result, Exception) and i not in tolerate:
+                raise result
+        return results
+
+    def _contract(self, token_address: str) -> AsyncContract:
+        """
+        Get the cached ERC20 contract instance for a token.
+
+        Args:
+            token_address: Checksummed token contract address
+
+        Returns:
+            Contract instance
+        """
+        contract = self._contracts.get(token_address)
+        if contract is None:
+            contract = self._contracts[token_address] = self._erc20(address=token_address)
+        return contract
+
+    async def _eth_call_batch(self, calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+        """
+        Execute read-only calls as JSON-RPC batches of eth_call requests.
+
+        Fallback for when Multicall3 is unavailable. Calls are split into
+        batches of RPC_BATCH_SIZE, sent concurrently.
+
+        Args:
+            calls: (target address, calldata) pairs
+
+        Returns:
+            Return data for each call, or None where that call failed or
+            returned nothing
+        """
+        chunks = [
+            calls[start:start + RPC_BATCH_SIZE]
+            for start in range(0, len(calls), RPC_BATCH_SIZE)
+        ]
+        chunk_results = await asyncio.gather(*(
+            self._rpc_batch(
+                *(
+                    functools.partial(self.w3.eth.call, {"to": target, "data": call_data})
+                    for target, call_data in chunk
+                ),
+                tolerate=range(len(chunk)),
+            )
+            for chunk in chunks
+        ))
+        return [
+            None if isinstance(result, Exception) or not result else bytes(result)
+            for results in chunk_results
+            for result in results
+        ]
+
+    async def _multicall3(self, calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+        """
+        Execute read-only calls in a single eth_call through Multicall3.
+
+        Args:
+            calls: (target address, calldata) pairs
+
+        Returns:
+            Return data for each call, or None where that call reverted or
+            returned nothing (e.g. the target is not a contract)
+        """
+        results = await self._multicall.functions.aggregate3(
+            [(target, True, call_data) for target, call_data in calls]
+        ).call()
+        return [
+            return_data if success and return_data else None
+            for success, return_data in results
+        ]
 
     async def _get_token_decimals(self, token_address: str) -> int:
         """
-        Get token decimals.
+        Get token decimals via RPC and cache them.
 
         Args:
             token_address: Token contract address
 
         Returns:
-            Number of decimals (default 18 if call fails)
+            Number of decimals (default 18 if call fails; the default is not cached)
         """
         try:
-            contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
-            return await contract.functions.decimals().call()
+            contract = self._contract(token_address)
+            decimals = await contract.functions.decimals().call()
         except Exception as e:
             logger.warning(f"Failed to get decimals for {token_address}: {e}, using default 18")
             return 18
+        self._remember_decimals(token_address, decimals)
+        return decimals
 
     async def _sign_and_send_transaction(
         self,
@@ -332,21 +1105,28 @@ class Web3Helper:
             Transaction hash
 
         Raises:
-            TransactionFailedException: When transaction fails
+            TransactionFailedException: When transaction fails; ``tx_hash`` is
+                set if it was already broadcast
         """
+        tx_hash_hex = ""
         try:
-            # Sign transaction
-            signed_txn = self.account.sign_transaction(transaction)
-            
-            # Send transaction
-            tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            try:
+                # Sign transaction
+                signed_txn = self.account.sign_transaction(transaction)
+                
+                # Send transaction
+                tx_hash = await self.w3.eth.send_raw_transaction(signed_txn.raw_transaction)
+            except Exception:
+                # The nonce was not used; resync from the node next time
+                self._last_nonce = None
+                raise
             tx_hash_hex = tx_hash.hex()
             logger.info(f"Transaction sent: {tx_hash_hex}")
             
             # Wait for receipt if requested
             if wait_for_receipt:
                 logger.info("Waiting for transaction confirmation...")
-                receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=TX_TIMEOUT)
+                receipt = await self.wait_for_receipt(tx_hash)
                 
                 if receipt["status"] == 0:
                     raise TransactionFailedException(
@@ -362,4 +1142,4 @@ class Web3Helper:
             logger.error(f"Transaction failed: {e}")
             if isinstance(e, TransactionFailedException):
                 raise
-            raise TransactionFailedException(reason=str(e))
+            raise TransactionFailedException(tx_hash=tx_hash_hex, reason=str(e))
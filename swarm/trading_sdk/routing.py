@@ -1,15 +1,21 @@
 """Trading platform routing strategies."""
 
 from enum import Enum
-from typing import Optional
+from typing import Callable, Final, Optional
 from decimal import Decimal
 import logging
 
 from swarm.shared.models import Quote
-from .exceptions import NoLiquidityException
+from .exceptions import NoLiquidityException, InvalidRoutingStrategyException
 
 logger = logging.getLogger(__name__)
 
+# Platform names; use these rather than repeating the literals
+PLATFORM_CCA: Final[str] = "cross_chain_access"
+PLATFORM_MM: Final[str] = "market_maker"
+
+_ZERO: Final[Decimal] = Decimal(0)
+
 
 class RoutingStrategy(str, Enum):
     """Platform routing strategy."""
@@ -30,6 +36,9 @@ class PlatformOption:
         error: Error message if unavailable
     """
     
+    # Built for every platform on every trade(); skip the per-instance __dict__
+    __slots__ = ("platform", "quote", "available", "error", "_effective_rate")
+    
     def __init__(
         self,
         platform: str,
@@ -41,20 +50,150 @@ class PlatformOption:
         self.quote = quote
         self.available = available
         self.error = error
+        
+        # Quotes are immutable, so the rate only needs computing once
+        if quote and quote.sell_amount != 0:
+            self._effective_rate = quote.buy_amount / quote.sell_amount
+        else:
+            self._effective_rate = _ZERO
     
     def get_effective_rate(self) -> Decimal:
         """Get effective rate for comparison.
         
         Returns:
-            Rate (buy_amount / sell_amount)
+            Rate (buy_amount / sell_amount), or 0 without a usable quote
         """
-        if not self.quote:
-            return Decimal("0")
-        
-        if self.quote.sell_amount == 0:
-            return Decimal("0")
-        
-        return self.quote.buy_amount / self.quote.sell_amount
+        return self._effective_rate
+
+
+def _select_cross_chain_only(
+    cross_chain_access_option: PlatformOption,
+    market_maker_option: PlatformOption,
+    cross_chain_access_available: bool,
+    market_maker_available: bool,
+    is_buy: bool,
+) -> PlatformOption:
+    """CROSS_CHAIN_ACCESS_ONLY: Cross-Chain Access or nothing."""
+    if not cross_chain_access_available:
+        raise NoLiquidityException(
+            f"Cross-Chain Access not available: {cross_chain_access_option.error}"
+        )
+    logger.info("Selected: Cross-Chain Access (CROSS_CHAIN_ACCESS_ONLY strategy)")
+    return cross_chain_access_option
+
+
+def _select_mm_only(
+    cross_chain_access_option: PlatformOption,
+    market_maker_option: PlatformOption,
+    cross_chain_access_available: bool,
+    market_maker_available: bool,
+    is_buy: bool,
+) -> PlatformOption:
+    """MARKET_MAKER_ONLY: Market Maker or nothing."""
+    if not market_maker_available:
+        raise NoLiquidityException(
+            f"Market Maker not available: {market_maker_option.error}"
+        )
+    logger.info("Selected: Market Maker (MARKET_MAKER_ONLY strategy)")
+    return market_maker_option
+
+
+def _select_cca_first(
+    cross_chain_access_option: PlatformOption,
+    market_maker_option: PlatformOption,
+    cross_chain_access_available: bool,
+    market_maker_available: bool,
+    is_buy: bool,
+) -> PlatformOption:
+    """CROSS_CHAIN_ACCESS_FIRST: prefer Cross-Chain Access, else Market Maker."""
+    if cross_chain_access_available:
+        logger.info("Selected: Cross-Chain Access (CROSS_CHAIN_ACCESS_FIRST strategy)")
+        return cross_chain_access_option
+    logger.info("Selected: Market Maker (fallback from Cross-Chain Access)")
+    return market_maker_option
+
+
+def _select_mm_first(
+    cross_chain_access_option: PlatformOption,
+    market_maker_option: PlatformOption,
+    cross_chain_access_available: bool,
+    market_maker_available: bool,
+    is_buy: bool,
+) -> PlatformOption:
+    """MARKET_MAKER_FIRST: prefer Market Maker, else Cross-Chain Access."""
+    if market_maker_available:
+        logger.info("Selected: Market Maker (MARKET_MAKER_FIRST strategy)")
+        return market_maker_option
+    logger.info("Selected: Cross-Chain Access (fallback from Market Maker)")
+    return cross_chain_access_option
+
+
+def _select_best_price(
+    cross_chain_access_option: PlatformOption,
+    market_maker_option: PlatformOption,
+    cross_chain_access_available: bool,
+    market_maker_available: bool,
+    is_buy: bool,
+) -> PlatformOption:
+    """BEST_PRICE: the only available platform, or the one with the better rate."""
+    if cross_chain_access_available and not market_maker_available:
+        logger.info("Selected: Cross-Chain Access (only available)")
+        return cross_chain_access_option
+    elif market_maker_available and not cross_chain_access_available:
+        logger.info("Selected: Market Maker (only available)")
+        return market_maker_option
+    
+    # Both available - compare prices
+    cross_chain_access_rate = cross_chain_access_option.get_effective_rate()
+    market_maker_rate = market_maker_option.get_effective_rate()
+    
+    logger.info(
+        "Comparing rates - Cross-Chain Access: %s, Market Maker: %s",
+        cross_chain_access_rate,
+        market_maker_rate,
+    )
+    
+    # Compare buy/sell ratios by cross-multiplying: for positive sell amounts
+    # a/b <= c/d iff a*d <= c*b, which is exact where the quotients are rounded
+    cross_chain_access_quote = cross_chain_access_option.quote
+    market_maker_quote = market_maker_option.quote
+    if cross_chain_access_quote.sell_amount > 0 and market_maker_quote.sell_amount > 0:
+        cross_chain_access_weighted = cross_chain_access_quote.buy_amount * market_maker_quote.sell_amount
+        market_maker_weighted = market_maker_quote.buy_amount * cross_chain_access_quote.sell_amount
+    else:
+        cross_chain_access_weighted = cross_chain_access_rate
+        market_maker_weighted = market_maker_rate
+    
+    # For BUY orders: lower rate is better (less cost per token)
+    # For SELL orders: higher rate is better (more return per token)
+    if is_buy:
+        if cross_chain_access_weighted <= market_maker_weighted:
+            logger.info("Selected: Cross-Chain Access (better buy rate: %s)", cross_chain_access_rate)
+            return cross_chain_access_option
+        else:
+            logger.info("Selected: Market Maker (better buy rate: %s)", market_maker_rate)
+            return market_maker_option
+    else:
+        if cross_chain_access_weighted >= market_maker_weighted:
+            logger.info("Selected: Cross-Chain Access (better sell rate: %s)", cross_chain_access_rate)
+            return cross_chain_access_option
+        else:
+            logger.info("Selected: Market Maker (better sell rate: %s)", market_maker_rate)
+            return market_maker_option
+
+
+# Strategy -> selector(cross_chain_access_option, market_maker_option,
+#                      cross_chain_access_available, market_maker_available, is_buy)
+_STRATEGY_HANDLERS: dict[
+    RoutingStrategy,
+    Callable[[PlatformOption, PlatformOption, bool, bool, bool], PlatformOption],
+] = {
+    RoutingStrategy.CROSS_CHAIN_ACCESS_ONLY: _select_cross_chain_only,
+    RoutingStrategy.MARKET_MAKER_ONLY: _select_mm_only,
+    RoutingStrategy.CROSS_CHAIN_ACCESS_FIRST: _select_cca_first,
+    RoutingStrategy.MARKET_MAKER_FIRST: _select_mm_first,
+    RoutingStrategy.BEST_PRICE: _select_best_price,
+}
 
 
 class Router:
@@ -84,8 +223,14 @@ class Router:
         
         Raises:
             NoLiquidityException: If no platforms available
+            InvalidRoutingStrategyException: If strategy is not a known RoutingStrategy
         """
-        logger.info(f"Routing with strategy: {strategy.value}")
+        try:
+            handler = _STRATEGY_HANDLERS[strategy]
+        except KeyError:
+            raise InvalidRoutingStrategyException(f"Unknown routing strategy: {strategy}") from None
+        
+        logger.debug("Routing with strategy: %s", strategy.value)
         
         # Check availability
         cross_chain_access_available = cross_chain_access_option.available and cross_chain_access_option.quote is not None
@@ -102,74 +247,10 @@ class Router:
                 f"No platforms available. {'; '.join(errors)}"
             )
         
-        # Strategy: CROSS_CHAIN_ACCESS_ONLY
-        if strategy == RoutingStrategy.CROSS_CHAIN_ACCESS_ONLY:
-            if not cross_chain_access_available:
-                raise NoLiquidityException(
-                    f"Cross-Chain Access not available: {cross_chain_access_option.error}"
-                )
-            logger.info("Selected: Cross-Chain Access (CROSS_CHAIN_ACCESS_ONLY strategy)")
-            return cross_chain_access_option
-        
-        # Strategy: MARKET_MAKER_ONLY
-        if strategy == RoutingStrategy.MARKET_MAKER_ONLY:
-            if not market_maker_available:
-                raise NoLiquidityException(
-                    f"Market Maker not available: {market_maker_option.error}"
-                )
-            logger.info("Selected: Market Maker (MARKET_MAKER_ONLY strategy)")
-            return market_maker_option
-        
-        # Strategy: CROSS_CHAIN_ACCESS_FIRST
-        if strategy == RoutingStrategy.CROSS_CHAIN_ACCESS_FIRST:
-            if cross_chain_access_available:
-                logger.info("Selected: Cross-Chain Access (CROSS_CHAIN_ACCESS_FIRST strategy)")
-                return cross_chain_access_option
-            elif market_maker_available:
-                logger.info("Selected: Market Maker (fallback from Cross-Chain Access)")
-                return market_maker_option
-        
-        # Strategy: MARKET_MAKER_FIRST
-        if strategy == RoutingStrategy.MARKET_MAKER_FIRST:
-            if market_maker_available:
-                logger.info("Selected: Market Maker (MARKET_MAKER_FIRST strategy)")
-                return market_maker_option
-            elif cross_chain_access_available:
-                logger.info("Selected: Cross-Chain Access (fallback from Market Maker)")
-                return cross_chain_access_option
-        
-        # Strategy: BEST_PRICE (default)
-        if strategy == RoutingStrategy.BEST_PRICE:
-            if cross_chain_access_available and not market_maker_available:
-                logger.info("Selected: Cross-Chain Access (only available)")
-                return cross_chain_access_option
-            elif market_maker_available and not cross_chain_access_available:
-                logger.info("Selected: Market Maker (only available)")
-                return market_maker_option
-            
-            # Both available - compare prices
-            cross_chain_access_rate = cross_chain_access_option.get_effective_rate()
-            market_maker_rate = market_maker_option.get_effective_rate()
-            
-            logger.info(f"Comparing rates - Cross-Chain Access: {cross_chain_access_rate}, Market Maker: {market_maker_rate}")
-            
-            # For BUY orders: lower rate is better (less cost per token)
-            # For SELL orders: higher rate is better (more return per token)
-            if is_buy:
-                if cross_chain_access_rate <= market_maker_rate:
-                    logger.info(f"Selected: Cross-Chain Access (better buy rate: {cross_chain_access_rate})")
-                    return cross_chain_access_option
-                else:
-                    logger.info(f"Selected: Market Maker (better buy rate: {market_maker_rate})")
-                    return market_maker_option
-            else:
-                if cross_chain_access_rate >= market_maker_rate:
-                    logger.info(f"Selected: Cross-Chain Access (better sell rate: {cross_chain_access_rate})")
-                    return cross_chain_access_option
-                else:
-                    logger.info(f"Selected: Market Maker (better sell rate: {market_maker_rate})")
-                    return market_maker_option
-        
-        # Fallback (shouldn't reach here)
-        logger.warning("Routing fallback - selecting first available")
-        return cross_chain_access_option if cross_chain_access_available else market_maker_option
+        return handler(
+            cross_chain_access_option,
+            market_maker_option,
+            cross_chain_access_available,
+            market_maker_available,
+            is_buy,
+        )
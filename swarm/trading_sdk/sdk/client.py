@@ -1,24 +1,63 @@
 """Unified Trading SDK combining Market Maker and Cross-Chain Access platforms."""
 
 import asyncio
+import contextlib
 import logging
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+
+import httpx
 
 from swarm.shared.models import Network, Quote, TradeResult
 from swarm.shared.config import get_is_dev
 from swarm.shared.remote_config import close_config_fetchers
 from swarm.market_maker_sdk import MarketMakerClient
 from swarm.cross_chain_access_sdk import CrossChainAccessClient, MarketClosedException as CrossChainAccessMarketClosedException
-from ..routing import Router, RoutingStrategy, PlatformOption
+from ..routing import Router, RoutingStrategy, PlatformOption, PLATFORM_CCA, PLATFORM_MM
 from ..exceptions import (
     TradingException,
     NoLiquidityException,
     AllPlatformsFailedException,
+    InvalidRoutingStrategyException,
 )
 
 logger = logging.getLogger(__name__)
 
+# Failed quotes are remembered briefly so an unavailable platform is not
+# re-queried on every call
+_QUOTE_ERROR_TTL = 2.0
+
+# Strategies that may retry on the other platform when the selected one fails
+_FALLBACK_STRATEGIES = frozenset({
+    RoutingStrategy.BEST_PRICE,
+    RoutingStrategy.CROSS_CHAIN_ACCESS_FIRST,
+    RoutingStrategy.MARKET_MAKER_FIRST,
+})
+
+
+# Stateless placeholders for platforms that are not queried; shared, never mutated
+_CCA_NO_SYMBOL_OPTION = PlatformOption(
+    platform=PLATFORM_CCA,
+    available=False,
+    error="Symbol not provided"
+)
+_CCA_EXCLUDED_OPTION = PlatformOption(
+    platform=PLATFORM_CCA,
+    available=False,
+    error="Excluded by routing strategy"
+)
+_MM_EXCLUDED_OPTION = PlatformOption(
+    platform=PLATFORM_MM,
+    available=False,
+    error="Excluded by routing strategy"
+)
+
+
+async def _resolved(option: PlatformOption) -> PlatformOption:
+    """Wrap a placeholder option in a coroutine so trade() can gather uniformly."""
+    return option
+
 
 class TradingClient:
     """Unified trading client with smart routing between Market Maker and Cross-Chain Access.
@@ -69,6 +108,8 @@ class TradingClient:
         user_email: Optional[str] = None,
         rpc_url: Optional[str] = None,
         routing_strategy: RoutingStrategy = RoutingStrategy.BEST_PRICE,
+        quote_ttl: float = 10.0,
+        quote_timeout: float = 2.0,
     ):
         """Initialize unified trading client.
         
@@ -79,10 +120,33 @@ class TradingClient:
             user_email: Optional email for authentication
             rpc_url: Optional custom RPC URL
             routing_strategy: Default routing strategy
+            quote_ttl: Seconds a platform quote is reused before re-fetching
+                (default: 10, 0 disables caching)
+            quote_timeout: Seconds to wait for each platform's quote before
+                treating it as unavailable (default: 2)
         """
         self.network = network
         self.routing_strategy = routing_strategy
         
+        # Quote cache: key -> (quote, error, expires_at)
+        self._quote_ttl = quote_ttl
+        self._quote_cache: dict[tuple, tuple[Optional[Quote], Optional[Exception], float]] = {}
+        self._quote_timeout = quote_timeout
+        # Quote fetches in progress, shared by concurrent callers for the same key
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Bumped by invalidate_quote_cache(); fetches started under an older
+        # generation don't write their result back
+        self._quote_generation = 0
+        
+        self._closed = False
+        self._close_lock = asyncio.Lock()
+        
+        # One HTTP connection pool for both platforms' API clients, so
+        # keep-alive connections to shared Swarm hosts are reused
+        self._transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=32, keepalive_expiry=60.0),
+        )
+        
         # Initialize Market Maker client
         self.market_maker_client = MarketMakerClient(
             network=network,
@@ -90,6 +154,7 @@ class TradingClient:
             rpq_api_key=rpq_api_key,
             user_email=user_email,
             rpc_url=rpc_url,
+            transport=self._transport,
         )
         
         # Initialize Cross-Chain Access client
@@ -98,34 +163,77 @@ class TradingClient:
             private_key=private_key,
             user_email=user_email,
             rpc_url=rpc_url,
+            transport=self._transport,
         )
         
         logger.info(
-            f"Initialized Trading SDK for {network.name} "
-            f"({'dev' if get_is_dev() else 'prod'} mode) "
-            f"with routing strategy: {routing_strategy.value}"
+            "Initialized Trading SDK for %s (%s mode) with routing strategy: %s",
+            network.name,
+            "dev" if get_is_dev() else "prod",
+            routing_strategy.value,
         )
     
     async def __aenter__(self):
-        """Async context manager entry."""
-        await self.market_maker_client.__aenter__()
-        await self.cross_chain_access_client.__aenter__()
+        """Async context manager entry.
+        
+        If a sub-client fails to enter, the ones already entered are exited
+        before the error propagates.
+        """
+        async with contextlib.AsyncExitStack() as stack:
+            # Registered first so the shared pool closes after both clients
+            stack.push_async_callback(self._transport.aclose)
+            await stack.enter_async_context(self.market_maker_client)
+            await stack.enter_async_context(self.cross_chain_access_client)
+            # Entered cleanly; from here on close() owns the cleanup
+            stack.pop_all()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.market_maker_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.cross_chain_access_client.__aexit__(exc_type, exc_val, exc_tb)
+        await self.close()
     
     async def close(self):
-        """Close all clients and cleanup resources."""
-        await self.market_maker_client.close()
-        await self.cross_chain_access_client.close()
+        """Close all clients and cleanup resources.
         
-        # Close remote config fetcher sessions
-        await close_config_fetchers()
+        Sub-clients and remote config fetchers are closed concurrently; a
+        failure in one is logged and does not stop the others. Safe to call
+        more than once.
+        """
+        async with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+            inflight = list(self._inflight.values())
+            for task in inflight:
+                task.cancel()
+            await asyncio.gather(*inflight, return_exceptions=True)
+            
+            results = await asyncio.gather(
+                self.market_maker_client.close(),
+                self.cross_chain_access_client.close(),
+                # Close remote config fetcher sessions
+                close_config_fetchers(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning("Error while closing Trading SDK: %s", result)
+            
+            # Sub-clients only borrow the shared pool
+            await self._transport.aclose()
+            
+            logger.info("Trading SDK closed")
+    
+    def invalidate_quote_cache(self) -> None:
+        """Drop all cached quotes so the next request hits the platforms.
         
-        logger.info("Trading SDK closed")
+        Fetches already in flight still answer their current callers, but
+        their results are not cached and new callers start a fresh fetch.
+        """
+        self._quote_generation += 1
+        self._quote_cache.clear()
+        self._inflight.clear()
     
     async def get_quotes(
         self,
@@ -134,6 +242,7 @@ class TradingClient:
         from_amount: Optional[Decimal] = None,
         to_amount: Optional[Decimal] = None,
         to_token_symbol: Optional[str] = None,
+        quote_timeout: Optional[float] = None,
     ) -> dict[str, Optional[Quote]]:
         """Get quotes from all available platforms.
         
@@ -143,6 +252,7 @@ class TradingClient:
             from_amount: Amount to sell (optional)
             to_amount: Amount to buy (optional)
             to_token_symbol: Token symbol for Cross-Chain Access (e.g., "AAPL")
+            quote_timeout: Override the client's per-platform quote timeout
         
         Returns:
             Dictionary with platform names as keys and quotes as values
@@ -157,23 +267,25 @@ class TradingClient:
             >>> print(f"Market Maker: {quotes['market_maker'].rate if quotes['market_maker'] else 'N/A'}")
             >>> print(f"Cross-Chain Access: {quotes['cross_chain_access'].rate if quotes['cross_chain_access'] else 'N/A'}")
         """
-        # Get quotes in parallel
-        market_maker_task = self._get_market_maker_quote(from_token, to_token, from_amount, to_amount)
-        cross_chain_access_task = self._get_cross_chain_access_quote(to_token_symbol) if to_token_symbol else None
-        
-        results = await asyncio.gather(
-            market_maker_task,
-            cross_chain_access_task if cross_chain_access_task else asyncio.sleep(0),
-            return_exceptions=True
-        )
+        timeout = self._quote_timeout if quote_timeout is None else quote_timeout
         
-        market_maker_quote = results[0] if not isinstance(results[0], Exception) else None
-        cross_chain_access_quote = results[1] if cross_chain_access_task and not isinstance(results[1], Exception) else None
+        # Get quotes in parallel, only from platforms that can quote this pair
+        tasks = {
+            PLATFORM_MM: self._get_market_maker_quote(from_token, to_token, from_amount, to_amount, timeout),
+        }
+        if to_token_symbol:
+            tasks[PLATFORM_CCA] = self._get_cross_chain_access_quote(to_token_symbol, timeout)
         
-        return {
-            "market_maker": market_maker_quote,
-            "cross_chain_access": cross_chain_access_quote,
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+        quotes: dict[str, Optional[Quote]] = {
+            PLATFORM_MM: None,
+            PLATFORM_CCA: None,
         }
+        for platform, result in zip(tasks, results):
+            if not isinstance(result, Exception):
+                quotes[platform] = result
+        return quotes
     
     async def trade(
         self,
@@ -184,6 +296,7 @@ class TradingClient:
         to_amount: Optional[Decimal] = None,
         to_token_symbol: Optional[str] = None,
         routing_strategy: Optional[RoutingStrategy] = None,
+        quote_timeout: Optional[float] = None,
     ) -> TradeResult:
         """Execute a trade with smart routing between platforms.
         
@@ -201,12 +314,14 @@ class TradingClient:
             to_amount: Amount to buy (optional)
             to_token_symbol: Token symbol for Cross-Chain Access (required for Cross-Chain Access, e.g., "AAPL")
             routing_strategy: Override default routing strategy
+            quote_timeout: Override the client's per-platform quote timeout
         
         Returns:
             TradeResult with transaction details
         
         Raises:
             ValueError: If both or neither amounts provided
+            InvalidRoutingStrategyException: If routing_strategy is not a known strategy
             NoLiquidityException: If no platforms available
             AllPlatformsFailedException: If all platforms fail
         
@@ -236,109 +351,113 @@ class TradingClient:
                 "Must provide either from_amount OR to_amount, not both"
             )
         
-        strategy = routing_strategy or self.routing_strategy
+        # Normalise to the enum member so strategies compare by identity
+        try:
+            strategy = RoutingStrategy(routing_strategy or self.routing_strategy)
+        except ValueError:
+            raise InvalidRoutingStrategyException(
+                f"Unknown routing strategy: {routing_strategy or self.routing_strategy}"
+            ) from None
+        timeout = self._quote_timeout if quote_timeout is None else quote_timeout
         is_buy = from_amount is not None  # Buying if we know how much we're spending
         
         logger.info(
-            f"Starting trade: {from_token} -> {to_token} "
-            f"(strategy: {strategy.value})"
+            "Starting trade: %s -> %s (strategy: %s)",
+            from_token,
+            to_token,
+            strategy.value,
         )
         
-        # Step 1: Get quotes from all platforms
-        market_maker_option = await self._get_market_maker_option(
-            from_token, to_token, from_amount, to_amount
-        )
+        if not to_token_symbol and strategy is RoutingStrategy.CROSS_CHAIN_ACCESS_ONLY:
+            # Nothing to quote: Cross-Chain Access needs a symbol
+            raise NoLiquidityException("Cross-Chain Access not available: Symbol not provided")
         
-        cross_chain_access_option = await self._get_cross_chain_access_option(
-            to_token_symbol, from_amount, to_amount
-        ) if to_token_symbol else PlatformOption(
-            platform="cross_chain_access",
-            available=False,
-            error="Symbol not provided"
+        # Step 1: Get quotes concurrently from the platforms the strategy may use
+        if strategy is RoutingStrategy.CROSS_CHAIN_ACCESS_ONLY:
+            market_maker_fetch = _resolved(_MM_EXCLUDED_OPTION)
+        else:
+            market_maker_fetch = self._get_market_maker_option(
+                from_token, to_token, from_amount, to_amount, timeout
+            )
+        
+        if strategy is RoutingStrategy.MARKET_MAKER_ONLY:
+            cross_chain_access_fetch = _resolved(_CCA_EXCLUDED_OPTION)
+        elif not to_token_symbol:
+            cross_chain_access_fetch = _resolved(_CCA_NO_SYMBOL_OPTION)
+        else:
+            cross_chain_access_fetch = self._get_cross_chain_access_option(
+                to_token_symbol, from_amount, to_amount, timeout
+            )
+        
+        # Option helpers report failures as unavailable options, never raise
+        market_maker_option, cross_chain_access_option = await asyncio.gather(
+            market_maker_fetch, cross_chain_access_fetch
         )
         
-        logger.info(
-            f"Platform availability - Market Maker: {market_maker_option.available}, "
-            f"Cross-Chain Access: {cross_chain_access_option.available}"
+        logger.debug(
+            "Platform availability - Market Maker: %s, Cross-Chain Access: %s",
+            market_maker_option.available,
+            cross_chain_access_option.available,
         )
         
         # Step 2: Select platform based on strategy
-        try:
-            selected = Router.select_platform(
-                cross_chain_access_option=cross_chain_access_option,
-                market_maker_option=market_maker_option,
-                strategy=strategy,
-                is_buy=is_buy,
-            )
-            
-            logger.info(f"Selected platform: {selected.platform}")
-            
-        except NoLiquidityException as e:
-            logger.error(f"No liquidity available: {e}")
-            raise
+        if not to_token_symbol and market_maker_option.available:
+            # Cross-Chain Access can't quote without a symbol, so every
+            # remaining strategy resolves to Market Maker
+            selected = market_maker_option
+        else:
+            try:
+                selected = Router.select_platform(
+                    cross_chain_access_option=cross_chain_access_option,
+                    market_maker_option=market_maker_option,
+                    strategy=strategy,
+                    is_buy=is_buy,
+                )
+            except NoLiquidityException as e:
+                logger.error("No liquidity available: %s", e)
+                raise
+        
+        # Router already logs its choice at INFO
+        logger.debug("Selected platform: %s", selected.platform)
         
         # Step 3: Execute trade on selected platform
         try:
-            if selected.platform == "cross_chain_access":
-                result = await self._execute_cross_chain_access_trade(
-                    rwa_token_address=to_token,
-                    rwa_symbol=to_token_symbol,
-                    rwa_amount=to_amount,
-                    usdc_amount=from_amount,
-                    user_email=user_email,
-                )
-            else:  # Market Maker
-                result = await self._execute_market_maker_trade(
-                    from_token=from_token,
-                    to_token=to_token,
-                    from_amount=from_amount,
-                    to_amount=to_amount,
-                )
-            
-            logger.info(
-                f"Trade successful on {selected.platform}: {result.tx_hash}"
+            result = await self._execute_on_platform(
+                selected.platform, from_token, to_token, to_token_symbol,
+                from_amount, to_amount, user_email,
             )
             
+            logger.info("Trade successful on %s: %s", selected.platform, result.tx_hash)
+            
+            # Balances and inventory moved; don't reuse pre-trade quotes
+            self.invalidate_quote_cache()
             return result
             
         except Exception as e:
-            logger.error(f"Trade failed on {selected.platform}: {e}")
+            logger.error("Trade failed on %s: %s", selected.platform, e)
             
             # Try fallback if strategy allows
-            if strategy == RoutingStrategy.BEST_PRICE or \
-               strategy in [RoutingStrategy.CROSS_CHAIN_ACCESS_FIRST, RoutingStrategy.MARKET_MAKER_FIRST]:
+            if strategy in _FALLBACK_STRATEGIES:
                 
-                fallback_platform = "market_maker" if selected.platform == "cross_chain_access" else "cross_chain_access"
-                fallback_option = market_maker_option if selected.platform == "cross_chain_access" else cross_chain_access_option
+                fallback_platform = PLATFORM_MM if selected.platform == PLATFORM_CCA else PLATFORM_CCA
+                fallback_option = market_maker_option if selected.platform == PLATFORM_CCA else cross_chain_access_option
                 
                 if fallback_option.available:
-                    logger.info(f"Attempting fallback to {fallback_platform}")
+                    logger.info("Attempting fallback to %s", fallback_platform)
                     
                     try:
-                        if fallback_platform == "cross_chain_access":
-                            result = await self._execute_cross_chain_access_trade(
-                                rwa_token_address=to_token,
-                                rwa_symbol=to_token_symbol,
-                                rwa_amount=to_amount,
-                                usdc_amount=from_amount,
-                                user_email=user_email,
-                            )
-                        else:  # Market Maker
-                            result = await self._execute_market_maker_trade(
-                                from_token=from_token,
-                                to_token=to_token,
-                                from_amount=from_amount,
-                                to_amount=to_amount,
-                            )
-                        
-                        logger.info(
-                            f"Fallback successful on {fallback_platform}: {result.tx_hash}"
+                        result = await self._execute_on_platform(
+                            fallback_platform, from_token, to_token, to_token_symbol,
+                            from_amount, to_amount, user_email,
                         )
                         
+                        logger.info("Fallback successful on %s: %s", fallback_platform, result.tx_hash)
+                        
+                        self.invalidate_quote_cache()
                         return result
                         
                     except Exception as fallback_error:
-                        logger.error(f"Fallback failed: {fallback_error}")
+                        logger.error("Fallback failed: %s", fallback_error)
                         raise AllPlatformsFailedException(
                             f"Primary ({selected.platform}): {e}. "
                             f"Fallback ({fallback_platform}): {fallback_error}"
@@ -353,20 +472,26 @@ class TradingClient:
         to_token: str,
         from_amount: Optional[Decimal],
         to_amount: Optional[Decimal],
+        timeout: float,
     ) -> PlatformOption:
         """Get Market Maker platform option with quote."""
         try:
-            quote = await self.market_maker_client.get_quote(
-                from_token=from_token,
-                to_token=to_token,
-                from_amount=from_amount,
-                to_amount=to_amount,
+            quote = await asyncio.wait_for(
+                self._fetch_market_maker_quote(from_token, to_token, from_amount, to_amount),
+                timeout=timeout,
+            )
+            return PlatformOption(platform=PLATFORM_MM, quote=quote)
+        except asyncio.TimeoutError:
+            logger.warning("Market Maker quote timed out after %ss", timeout)
+            return PlatformOption(
+                platform=PLATFORM_MM,
+                available=False,
+                error=f"quote timeout after {timeout}s"
             )
-            return PlatformOption(platform="market_maker", quote=quote)
         except Exception as e:
-            logger.warning(f"Market Maker quote failed: {e}")
+            logger.warning("Market Maker quote failed: %s", e)
             return PlatformOption(
-                platform="market_maker",
+                platform=PLATFORM_MM,
                 available=False,
                 error=str(e)
             )
@@ -376,29 +501,36 @@ class TradingClient:
         symbol: Optional[str],
         from_amount: Optional[Decimal],
         to_amount: Optional[Decimal],
+        timeout: float,
     ) -> PlatformOption:
         """Get Cross-Chain Access platform option with quote."""
         if not symbol:
+            return _CCA_NO_SYMBOL_OPTION
+        
+        try:
+            quote = await asyncio.wait_for(
+                self._fetch_cross_chain_access_quote(symbol),
+                timeout=timeout,
+            )
+            return PlatformOption(platform=PLATFORM_CCA, quote=quote)
+        except asyncio.TimeoutError:
+            logger.warning("Cross-Chain Access quote timed out after %ss", timeout)
             return PlatformOption(
-                platform="cross_chain_access",
+                platform=PLATFORM_CCA,
                 available=False,
-                error="Symbol not provided"
+                error=f"quote timeout after {timeout}s"
             )
-        
-        try:
-            quote = await self.cross_chain_access_client.get_quote(symbol)
-            return PlatformOption(platform="cross_chain_access", quote=quote)
         except CrossChainAccessMarketClosedException as e:
-            logger.warning(f"Cross-Chain Access market closed: {e}")
+            logger.warning("Cross-Chain Access market closed: %s", e)
             return PlatformOption(
-                platform="cross_chain_access",
+                platform=PLATFORM_CCA,
                 available=False,
                 error="Market closed"
             )
         except Exception as e:
-            logger.warning(f"Cross-Chain Access quote failed: {e}")
+            logger.warning("Cross-Chain Access quote failed: %s", e)
             return PlatformOption(
-                platform="cross_chain_access",
+                platform=PLATFORM_CCA,
                 available=False,
                 error=str(e)
             )
@@ -409,30 +541,164 @@ class TradingClient:
         to_token: str,
         from_amount: Optional[Decimal],
         to_amount: Optional[Decimal],
+        timeout: float,
     ) -> Optional[Quote]:
         """Get quote from Market Maker (helper for get_quotes)."""
         try:
-            return await self.market_maker_client.get_quote(
-                from_token=from_token,
-                to_token=to_token,
-                from_amount=from_amount,
-                to_amount=to_amount,
+            return await asyncio.wait_for(
+                self._fetch_market_maker_quote(from_token, to_token, from_amount, to_amount),
+                timeout=timeout,
             )
+        except asyncio.TimeoutError:
+            logger.warning("Market Maker quote timed out after %ss", timeout)
+            return None
         except Exception as e:
-            logger.warning(f"Market Maker quote failed: {e}")
+            logger.warning("Market Maker quote failed: %s", e)
             return None
     
-    async def _get_cross_chain_access_quote(self, symbol: Optional[str]) -> Optional[Quote]:
+    async def _get_cross_chain_access_quote(
+        self,
+        symbol: Optional[str],
+        timeout: float,
+    ) -> Optional[Quote]:
         """Get quote from Cross-Chain Access (helper for get_quotes)."""
         if not symbol:
             return None
         
         try:
-            return await self.cross_chain_access_client.get_quote(symbol)
+            return await asyncio.wait_for(
+                self._fetch_cross_chain_access_quote(symbol),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Cross-Chain Access quote timed out after %ss", timeout)
+            return None
         except Exception as e:
-            logger.warning(f"Cross-Chain Access quote failed: {e}")
+            logger.warning("Cross-Chain Access quote failed: %s", e)
             return None
     
+    async def _fetch_market_maker_quote(
+        self,
+        from_token: str,
+        to_token: str,
+        from_amount: Optional[Decimal],
+        to_amount: Optional[Decimal],
+    ) -> Quote:
+        """Get a Market Maker quote, served from the quote cache when fresh."""
+        return await self._cached_quote(
+            (PLATFORM_MM, from_token, to_token, from_amount, to_amount),
+            lambda: self.market_maker_client.get_quote(
+                from_token=from_token,
+                to_token=to_token,
+                from_amount=from_amount,
+                to_amount=to_amount,
+            ),
+        )
+    
+    async def _fetch_cross_chain_access_quote(self, symbol: str) -> Quote:
+        """Get a Cross-Chain Access quote, served from the quote cache when fresh."""
+        return await self._cached_quote(
+            (PLATFORM_CCA, symbol),
+            lambda: self.cross_chain_access_client.get_quote(symbol),
+        )
+    
+    async def _cached_quote(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[Quote]],
+    ) -> Quote:
+        """Return the cached quote for ``key``, calling ``fetch`` when missing or expired.
+        
+        Failures are cached for a shorter window and re-raised, so callers see
+        the same exception they would have got from the platform. Concurrent
+        misses for the same key share a single fetch.
+        """
+        now = time.monotonic()
+        entry = self._quote_cache.get(key)
+        if entry is not None and entry[2] > now:
+            quote, error, _ = entry
+            if error is not None:
+                raise error
+            return quote
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_quote(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        
+        # Shielded so one caller's timeout doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    def _forget_inflight(self, key: tuple, task: asyncio.Task) -> None:
+        """Drop a finished fetch from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved in case every waiter timed out
+        if not task.cancelled():
+            task.exception()
+    
+    async def _load_quote(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[Quote]],
+    ) -> Quote:
+        """Fetch a quote and cache the outcome unless the cache was invalidated meanwhile."""
+        if self._quote_ttl <= 0:
+            return await fetch()
+        
+        generation = self._quote_generation
+        try:
+            quote = await fetch()
+        except Exception as e:
+            if generation == self._quote_generation:
+                self._store_quote(key, None, e, _QUOTE_ERROR_TTL)
+            raise
+        if generation == self._quote_generation:
+            self._store_quote(key, quote, None, self._quote_ttl)
+        return quote
+    
+    def _store_quote(
+        self,
+        key: tuple,
+        quote: Optional[Quote],
+        error: Optional[Exception],
+        ttl: float,
+    ) -> None:
+        """Cache a quote result, evicting expired entries first."""
+        now = time.monotonic()
+        expired = [k for k, entry in self._quote_cache.items() if entry[2] <= now]
+        for k in expired:
+            del self._quote_cache[k]
+        self._quote_cache[key] = (quote, error, now + ttl)
+    
+    async def _execute_on_platform(
+        self,
+        platform: str,
+        from_token: str,
+        to_token: str,
+        to_token_symbol: Optional[str],
+        from_amount: Optional[Decimal],
+        to_amount: Optional[Decimal],
+        user_email: str,
+    ) -> TradeResult:
+        """Execute the trade on ``platform`` ("cross_chain_access" or "market_maker")."""
+        if platform == PLATFORM_CCA:
+            return await self._execute_cross_chain_access_trade(
+                rwa_token_address=to_token,
+                rwa_symbol=to_token_symbol,
+                rwa_amount=to_amount,
+                usdc_amount=from_amount,
+                user_email=user_email,
+            )
+        # Market Maker
+        return await self._execute_market_maker_trade(
+            from_token=from_token,
+            to_token=to_token,
+            from_amount=from_amount,
+            to_amount=to_amount,
+        )
+    
     async def _execute_market_maker_trade(
         self,
         from_token: str,